@@ -37,6 +37,7 @@ class Settings:
     neo4j_uri: str = "bolt://localhost:7687"
     neo4j_user: str = "neo4j"
     neo4j_password: str = "password"
+    neo4j_database: str = "neo4j"
 
     # OpenAI (for embeddings - optional)
     openai_api_key: Optional[str] = None
@@ -56,6 +57,13 @@ class Settings:
     max_results: int = 10
     similarity_threshold: float = 0.3
 
+    # Connection pooling
+    chroma_pool_size: int = 4
+    neo4j_pool_size: int = 50
+
+    # int8 양자화 임베딩으로 유사도 계산 (품질 검증 후 활성화)
+    use_int8_embeddings: bool = False
+
     def __post_init__(self):
         """환경 변수에서 설정 로드 및 경로 초기화"""
 
@@ -82,12 +90,14 @@ class Settings:
         self.neo4j_uri = os.getenv("NEO4J_URI", self.neo4j_uri)
         self.neo4j_user = os.getenv("NEO4J_USER", self.neo4j_user)
         self.neo4j_password = os.getenv("NEO4J_PASSWORD", self.neo4j_password)
+        self.neo4j_database = os.getenv("NEO4J_DATABASE", self.neo4j_database)
 
         # OpenAI
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
 
         # Boolean settings
         self.use_local_embeddings = os.getenv("USE_LOCAL_EMBEDDINGS", "true").lower() == "true"
+        self.use_int8_embeddings = os.getenv("USE_INT8_EMBEDDINGS", "false").lower() == "true"
 
         # Numeric settings
         try:
@@ -96,6 +106,12 @@ class Settings:
         except ValueError:
             pass
 
+        try:
+            self.chroma_pool_size = int(os.getenv("CHROMA_POOL_SIZE", str(self.chroma_pool_size)))
+            self.neo4j_pool_size = int(os.getenv("NEO4J_POOL_SIZE", str(self.neo4j_pool_size)))
+        except ValueError:
+            pass
+
         # Create directories if needed
         self.chroma_path.mkdir(parents=True, exist_ok=True)
 
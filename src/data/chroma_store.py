@@ -5,6 +5,7 @@ ChromaDB Vector Store - 시맨틱 검색
 """
 
 from typing import List, Optional, Any, Set
+import asyncio
 import sys
 import logging
 import re
@@ -30,10 +31,20 @@ class ChromaStore:
     - 도메인/메타데이터 필터링
     """
 
-    def __init__(self, settings):
+    def __init__(self, settings, pool_size: Optional[int] = None):
         self.settings = settings
         self.client = None
         self.collection = None
+        # 동시 쿼리 상한 — 한 요청이 스토어를 독점하지 않게
+        self._pool = asyncio.Semaphore(pool_size or getattr(settings, "chroma_pool_size", 4))
+        # 일괄 유사도용 지연 구축 SoA 행렬 (Chroma가 원본, 이건 파생 캐시)
+        self._emb_ids: Optional[List[str]] = None
+        self._emb_matrix = None      # np.float32 (N, d)
+        self._emb_norms = None       # np.float32 (N,)
+        # int8 양자화 변형 (use_int8_embeddings 설정 시) — 1/4 메모리 대역폭
+        self._emb_matrix_i8 = None   # np.int8 (N, d)
+        self._emb_scales = None      # np.float32 (N,) per-벡터 양자화 스케일
+        self._emb_norms_i8 = None    # np.float32 (N,)
 
     async def initialize(self):
         """ChromaDB 초기화"""
@@ -51,6 +62,13 @@ class ChromaStore:
             metadata={"description": "Polymath MCP concept embeddings"}
         )
 
+        # Embedding function for explicit query embedding (cacheable by callers)
+        try:
+            from chromadb.utils import embedding_functions
+            self._embedding_fn = embedding_functions.DefaultEmbeddingFunction()
+        except Exception:
+            self._embedding_fn = None
+
         print(f"ChromaDB initialized with {self.collection.count()} concepts", file=sys.stderr)
 
         # Cache available domains for fuzzy matching
@@ -121,6 +139,120 @@ class ChromaStore:
         # No match found - return normalized anyway (might still work)
         return normalized
 
+    def _invalidate_embedding_matrix(self):
+        """개념 추가/수정/삭제 시 파생 행렬 폐기"""
+        self._emb_ids = None
+        self._emb_matrix = None
+        self._emb_norms = None
+        self._emb_matrix_i8 = None
+        self._emb_scales = None
+        self._emb_norms_i8 = None
+
+    @staticmethod
+    def _quantize(vec):
+        """대칭 max-abs 양자화: float 벡터 → (int8 벡터, 스케일)"""
+        import numpy as np
+
+        v = np.asarray(vec, dtype=np.float32)
+        peak = float(np.max(np.abs(v))) if v.size else 0.0
+        if peak == 0.0:
+            return np.zeros(v.shape, dtype=np.int8), 0.0
+        scale = peak / 127.0
+        q = np.clip(np.round(v / scale), -127, 127).astype(np.int8)
+        return q, scale
+
+    def _ensure_embedding_matrix_int8(self) -> bool:
+        """float32 행렬에서 int8 행렬 + per-벡터 스케일을 지연 파생"""
+        if self._emb_matrix_i8 is not None:
+            return True
+        if not self._ensure_embedding_matrix():
+            return False
+        try:
+            import numpy as np
+
+            m = self._emb_matrix
+            peaks = np.max(np.abs(m), axis=1)
+            scales = np.maximum(peaks, 1e-12) / 127.0
+            q = np.clip(np.round(m / scales[:, None]), -127, 127).astype(np.int8)
+
+            self._emb_matrix_i8 = q
+            self._emb_scales = scales.astype(np.float32)
+            q32 = q.astype(np.int32)
+            self._emb_norms_i8 = np.sqrt(
+                (q32 * q32).sum(axis=1)
+            ).astype(np.float32)
+            return True
+        except Exception:
+            return False
+
+    def _ensure_embedding_matrix(self) -> bool:
+        """전체 임베딩을 연속 (N, d) float32 행렬로 지연 구축"""
+        if self._emb_matrix is not None:
+            return True
+        try:
+            import numpy as np
+
+            result = self.collection.get(include=["embeddings"])
+            if not result or not result["ids"] or result["embeddings"] is None:
+                return False
+
+            ids, embeddings = [], []
+            for cid, emb in zip(result["ids"], result["embeddings"]):
+                if emb is not None:
+                    ids.append(cid)
+                    embeddings.append(emb)
+            if not embeddings:
+                return False
+
+            self._emb_ids = ids
+            self._emb_matrix = np.asarray(embeddings, dtype=np.float32)
+            self._emb_norms = np.linalg.norm(self._emb_matrix, axis=1)
+            return True
+        except Exception:
+            return False
+
+    async def batch_similarity(
+        self,
+        query_embedding: List[float]
+    ) -> List[tuple]:
+        """쿼리 임베딩 대 전체 개념의 코사인 유사도 일괄 계산
+
+        per-쌍 await 대신 BLAS matmul 1회로 (id, similarity) 목록 반환.
+        행렬을 만들 수 없으면 빈 목록 (호출자가 per-쌍 경로로 폴백).
+        use_int8_embeddings 설정 시 int8 행렬로 스캔 (코사인은 스케일
+        불변이라 양자화 스케일은 소거, 오차 <1%).
+        """
+        if getattr(self.settings, "use_int8_embeddings", False) \
+                and self._ensure_embedding_matrix_int8():
+            import numpy as np
+
+            q_i8, _ = self._quantize(query_embedding)
+            q32 = q_i8.astype(np.int32)
+            q_norm = float(np.sqrt((q32 * q32).sum()))
+            dots = self._emb_matrix_i8.astype(np.int32) @ q32
+            denom = self._emb_norms_i8 * q_norm
+            sims = dots / np.maximum(denom, 1e-12)
+            return list(zip(self._emb_ids, sims.tolist()))
+
+        if not self._ensure_embedding_matrix():
+            return []
+
+        import numpy as np
+
+        q = np.asarray(query_embedding, dtype=np.float32)
+        denom = self._emb_norms * np.linalg.norm(q)
+        sims = (self._emb_matrix @ q) / np.maximum(denom, 1e-12)
+        return list(zip(self._emb_ids, sims.tolist()))
+
+    async def embed(self, text: str) -> Optional[List[float]]:
+        """텍스트를 쿼리 임베딩으로 변환 (호출자 측 캐싱용)"""
+        if self._embedding_fn is None:
+            return None
+        try:
+            return list(self._embedding_fn([text])[0])
+        except Exception:
+            return None
+
     async def add_concept(self, concept: Concept):
         """개념 추가"""
         self.collection.add(
@@ -135,6 +267,50 @@ class ChromaStore:
                 "era": concept.era or "modern"
             }]
         )
+        self._invalidate_embedding_matrix()
+
+    async def add_concepts_batch(
+        self,
+        concepts: List[Concept],
+        batch_size: int = 100,
+        max_concurrency: int = 8
+    ):
+        """개념 일괄 추가
+
+        문서를 길이순으로 정렬해 배치 내 임베딩 패딩 낭비를 줄이고,
+        배치 단위 add를 세마포어로 제한된 동시성으로 실행한다.
+        """
+        if not concepts:
+            return
+
+        ordered = sorted(concepts, key=lambda c: len(c.full_text or ""))
+        sem = asyncio.Semaphore(max_concurrency)
+
+        def _add(batch: List[Concept]):
+            embeddings = [c.embedding for c in batch]
+            self.collection.add(
+                ids=[c.id for c in batch],
+                documents=[c.full_text for c in batch],
+                embeddings=embeddings if all(e for e in embeddings) else None,
+                metadatas=[{
+                    "name": c.name,
+                    "domain": c.domain,
+                    "category": c.category,
+                    "scale": c.scale or "meso",
+                    "era": c.era or "modern"
+                } for c in batch]
+            )
+
+        async def _run(batch: List[Concept]):
+            async with sem:
+                # collection.add는 블로킹 — 이벤트 루프를 막지 않게 스레드로
+                await asyncio.to_thread(_add, batch)
+
+        await asyncio.gather(*(
+            _run(ordered[i:i + batch_size])
+            for i in range(0, len(ordered), batch_size)
+        ))
+        self._invalidate_embedding_matrix()
 
     async def search(
         self,
@@ -142,9 +318,13 @@ class ChromaStore:
         domains: Optional[List[str]] = None,
         exclude_domain: Optional[str] = None,
         metadata_filter: Optional[dict] = None,
-        limit: int = 10
+        limit: int = 10,
+        query_embedding: Optional[List[float]] = None
     ) -> List[Any]:
-        """시맨틱 검색 (도메인 유연 매칭 지원)"""
+        """시맨틱 검색 (도메인 유연 매칭 지원)
+
+        query_embedding이 주어지면 내부 임베딩 계산을 건너뛴다.
+        """
         where_filter = {}
 
         if domains:
@@ -165,12 +345,21 @@ class ChromaStore:
         if metadata_filter:
             where_filter.update(metadata_filter)
 
-        results = self.collection.query(
-            query_texts=[query],
-            n_results=limit,
-            where=where_filter if where_filter else None,
-            include=["documents", "metadatas", "distances"]
-        )
+        async with self._pool:
+            if query_embedding is not None:
+                results = self.collection.query(
+                    query_embeddings=[query_embedding],
+                    n_results=limit,
+                    where=where_filter if where_filter else None,
+                    include=["documents", "metadatas", "distances"]
+                )
+            else:
+                results = self.collection.query(
+                    query_texts=[query],
+                    n_results=limit,
+                    where=where_filter if where_filter else None,
+                    include=["documents", "metadatas", "distances"]
+                )
 
         concepts = []
         if results and results["ids"]:
@@ -271,6 +460,26 @@ class ChromaStore:
         similarity = np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))
         return float(similarity)
 
+    async def cosine_int8(
+        self,
+        a_int8: List[int],
+        b_int8: List[int]
+    ) -> float:
+        """int8 양자화 임베딩 간 코사인 유사도
+
+        int8→int32 누적으로 FP32 대비 1/4 대역폭.
+        코사인은 스케일 불변이라 per-벡터 양자화 스케일은 소거된다.
+        """
+        import numpy as np
+
+        a = np.asarray(a_int8, dtype=np.int8).astype(np.int32)
+        b = np.asarray(b_int8, dtype=np.int8).astype(np.int32)
+
+        norm = np.sqrt(float(np.dot(a, a))) * np.sqrt(float(np.dot(b, b)))
+        if norm == 0:
+            return 0.0
+        return float(np.dot(a, b) / norm)
+
     async def update_concept(self, concept: Concept):
         """개념 업데이트"""
         self.collection.update(
@@ -285,10 +494,12 @@ class ChromaStore:
                 "era": concept.era or "modern"
             }]
         )
+        self._invalidate_embedding_matrix()
 
     async def delete_concept(self, concept_id: str):
         """개념 삭제"""
         self.collection.delete(ids=[concept_id])
+        self._invalidate_embedding_matrix()
 
     def count(self) -> int:
         """총 개념 수"""
@@ -4,8 +4,10 @@ Neo4j Graph Store - 관계 기반 검색
 개념 간 관계, 계보, 융합 사례 등 그래프 데이터 담당
 """
 
+import asyncio
 import sys
 import logging
+from contextlib import asynccontextmanager
 from typing import List, Optional, Any, Dict
 
 # Suppress Neo4j driver logs (they go to stdout by default)
@@ -29,19 +31,26 @@ class Neo4jStore:
     - 도메인 간 거리 계산
     """
 
-    def __init__(self, settings):
+    def __init__(self, settings, pool_size: Optional[int] = None):
         self.settings = settings
         self.driver = None
+        self.pool_size = pool_size or getattr(settings, "neo4j_pool_size", 50)
+        self.database = getattr(settings, "neo4j_database", "neo4j")
+        # 동시 세션 체크아웃 상한 — 풀 고갈 시 대기 폭주 방지
+        self._session_gate = asyncio.Semaphore(min(self.pool_size, 10))
 
     async def initialize(self):
-        """Neo4j 연결 초기화"""
+        """Neo4j 연결 초기화 (커넥션 풀 + keep-alive)"""
         self.driver = AsyncGraphDatabase.driver(
             self.settings.neo4j_uri,
-            auth=(self.settings.neo4j_user, self.settings.neo4j_password)
+            auth=(self.settings.neo4j_user, self.settings.neo4j_password),
+            max_connection_pool_size=self.pool_size,
+            connection_acquisition_timeout=5.0,
+            keep_alive=True
         )
 
         # Create indexes
-        async with self.driver.session() as session:
+        async with self.session() as session:
             await session.run("""
                 CREATE INDEX concept_id IF NOT EXISTS FOR (c:Concept) ON (c.id)
             """)
@@ -59,6 +68,17 @@ class Neo4jStore:
         if self.driver:
             await self.driver.close()
 
+    @asynccontextmanager
+    async def session(self):
+        """풀에서 세션 체크아웃 (대상 DB 명시 + 동시성 게이트)
+
+        database를 항상 지정해 드라이버의 라우팅 왕복을 아끼고,
+        세마포어로 쿼리 폭주 시에도 풀이 고갈되지 않게 한다.
+        """
+        async with self._session_gate:
+            async with self.driver.session(database=self.database) as s:
+                yield s
+
     async def search(
         self,
         query: str,
@@ -71,7 +91,7 @@ class Neo4jStore:
         - 키워드 매칭
         - 관계 기반 확장
         """
-        async with self.driver.session() as session:
+        async with self.session() as session:
             domain_filter = ""
             if domains:
                 domain_filter = f"AND c.domain IN {domains}"
@@ -100,7 +120,7 @@ class Neo4jStore:
 
     async def get_relationships(self, concept_id: str) -> Dict[str, List[str]]:
         """개념의 관계 조회"""
-        async with self.driver.session() as session:
+        async with self.session() as session:
             result = await session.run("""
                 MATCH (c:Concept {id: $concept_id})
                 OPTIONAL MATCH (c)-[:RELATED_TO]->(related:Concept)
@@ -119,7 +139,7 @@ class Neo4jStore:
 
     async def get_ancestors(self, concept_id: str) -> List[Concept]:
         """선조 개념 조회"""
-        async with self.driver.session() as session:
+        async with self.session() as session:
             result = await session.run("""
                 MATCH (c:Concept {id: $concept_id})-[:DERIVED_FROM*1..5]->(ancestor:Concept)
                 RETURN DISTINCT ancestor
@@ -138,7 +158,7 @@ class Neo4jStore:
 
     async def get_descendants(self, concept_id: str) -> List[Concept]:
         """후손 개념 조회"""
-        async with self.driver.session() as session:
+        async with self.session() as session:
             result = await session.run("""
                 MATCH (c:Concept {id: $concept_id})<-[:DERIVED_FROM*1..5]-(descendant:Concept)
                 RETURN DISTINCT descendant
@@ -157,7 +177,7 @@ class Neo4jStore:
 
     async def get_key_influences(self, concept_id: str) -> str:
         """핵심 영향 관계 텍스트"""
-        async with self.driver.session() as session:
+        async with self.session() as session:
             result = await session.run("""
                 MATCH (c:Concept {id: $concept_id})-[r:INFLUENCES|INFLUENCED_BY]-(other:Concept)
                 RETURN type(r) as relation, other.name as name, r.description as description
@@ -178,7 +198,7 @@ class Neo4jStore:
         limit: int = 10
     ) -> List[FusionCase]:
         """융합 사례 검색"""
-        async with self.driver.session() as session:
+        async with self.session() as session:
             pattern_filter = "AND f.pattern = $pattern" if pattern else ""
             domain_filter = ""
             if domains:
@@ -214,7 +234,7 @@ class Neo4jStore:
         target_domains: Optional[List[str]] = None
     ) -> List[Any]:
         """구조적으로 유사한 개념 찾기"""
-        async with self.driver.session() as session:
+        async with self.session() as session:
             domain_filter = ""
             if target_domains:
                 domain_filter = f"AND target.domain IN {target_domains}"
@@ -239,7 +259,7 @@ class Neo4jStore:
 
     async def find_boundary_concepts(self, concept_id: str) -> List[Any]:
         """연결된 경계 개념 찾기"""
-        async with self.driver.session() as session:
+        async with self.session() as session:
             result = await session.run("""
                 MATCH (c:Concept {id: $concept_id})-[:USES]->(bc:BoundaryConcept)
                 RETURN bc, bc.centrality as centrality
@@ -262,7 +282,7 @@ class Neo4jStore:
         target_domains: Optional[List[str]] = None
     ) -> List[Any]:
         """경계 개념을 통해 연결된 다른 개념 찾기"""
-        async with self.driver.session() as session:
+        async with self.session() as session:
             domain_filter = ""
             if target_domains:
                 domain_filter = f"AND c.domain IN {target_domains}"
@@ -285,7 +305,7 @@ class Neo4jStore:
 
     async def get_domain_distance(self, domain_a: str, domain_b: str) -> float:
         """두 도메인 간 거리 계산"""
-        async with self.driver.session() as session:
+        async with self.session() as session:
             result = await session.run("""
                 MATCH (a:Domain {name: $domain_a}), (b:Domain {name: $domain_b})
                 MATCH path = shortestPath((a)-[:RELATED_TO*]-(b))
@@ -304,7 +324,7 @@ class Neo4jStore:
         concept_b_id: str
     ) -> Optional[Dict]:
         """두 개념 간 직접 연결 조회"""
-        async with self.driver.session() as session:
+        async with self.session() as session:
             result = await session.run("""
                 MATCH (a:Concept {id: $a_id})-[r]-(b:Concept {id: $b_id})
                 RETURN type(r) as type, r as relation
@@ -321,7 +341,7 @@ class Neo4jStore:
 
     async def get_concept_structure(self, concept_id: str) -> Dict:
         """개념의 구조적 특성 조회"""
-        async with self.driver.session() as session:
+        async with self.session() as session:
             result = await session.run("""
                 MATCH (c:Concept {id: $concept_id})-[:HAS_STRUCTURE]->(s:Structure)
                 RETURN s
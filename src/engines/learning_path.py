@@ -6,8 +6,11 @@ Learning Path System - 학습 경로 시스템
 """
 
 from typing import List, Optional, Dict, Any, Set, Tuple
+from array import array
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+import asyncio
 import random
 
 
@@ -67,6 +70,47 @@ class LearningPath:
     difficulty_range: Tuple[int, int]
     domains_covered: List[str]
     learning_objectives: List[str]
+    # SoA 수치 요약 — 통계 재계산 시 객체 그래프를 다시 순회하지 않도록 보관
+    _difficulties: array = field(default_factory=lambda: array('b'), repr=False)
+    _times: array = field(default_factory=lambda: array('H'), repr=False)
+
+
+# 나선형 경로 시간표 — 기본 경로(SPIRAL, max_steps=7)가 압도적으로 핫하므로 미리 계산
+_SPIRAL_TIMES = tuple(15 + i * 5 for i in range(16))
+
+
+@lru_cache(maxsize=32)
+def _spiral_focus(max_steps: int) -> Tuple[str, ...]:
+    """단계별 초점을 max_steps당 한 번만 계산"""
+    return tuple(
+        "기초 이해" if i < max_steps // 3
+        else "연결과 적용" if i < 2 * max_steps // 3
+        else "심층 탐구와 종합"
+        for i in range(max_steps)
+    )
+
+
+# 도전 경로 템플릿 — concept.name만 바뀌므로 모듈 수준에 한 번만 정의
+_CHALLENGE_TEMPLATES = (
+    ("존재론적 도전", "{n}은 실재하는가, 우리 모델인가?"),
+    ("환원 도전", "{n}을 더 기본적인 것으로 환원할 수 있는가?"),
+    ("연결 도전", "가장 멀어 보이는 분야와 {n}을 연결할 수 있는가?"),
+    ("역설 도전", "{n}과 관련된 역설을 해결할 수 있는가?"),
+    ("예측 도전", "{n}의 미래는 어떻게 될 것인가?"),
+)
+
+
+@lru_cache(maxsize=1024)
+def _make_placeholder(concept_id: str) -> ConceptNode:
+    """그래프에 없는 개념의 임시 노드 — 같은 id는 같은 노드를 재사용"""
+    return ConceptNode(
+        id=concept_id,
+        name=concept_id,
+        domain="general",
+        difficulty=ConceptDifficulty.INTERMEDIATE,
+        description=f"{concept_id} 개념",
+        key_questions=[f"{concept_id}란 무엇인가?"]
+    )
 
 
 class LearningPathGenerator:
@@ -206,7 +250,39 @@ class LearningPathGenerator:
             rag_pipeline: RAG 파이프라인 (개념 검색용)
         """
         self.rag = rag_pipeline
-        self.concept_graph = self.CONCEPT_GRAPH.copy()
+        # copy-on-write: 그래프를 확장하기 전까지는 클래스 dict를 그대로 공유
+        self.concept_graph = self.CONCEPT_GRAPH
+        self._rebuild_index()
+
+    def _ensure_owned_graph(self) -> None:
+        """그래프 변경 전 호출 — 공유 중이면 인스턴스 소유 복사본으로 전환"""
+        if self.concept_graph is self.CONCEPT_GRAPH:
+            self.concept_graph = self.CONCEPT_GRAPH.copy()
+
+    def _rebuild_index(self) -> None:
+        """그래프 순회용 정수 인덱스 재구축
+
+        문자열 키 해싱을 피하기 위해 개념마다 작은 int id를 부여하고,
+        related/fusion_potential 중 그래프에 실제 존재하는 개념만
+        인덱스 배열로 미리 변환해둔다.
+        """
+        self._id_to_idx = {cid: i for i, cid in enumerate(self.concept_graph)}
+        self._idx_to_node = list(self.concept_graph.values())
+        self._related_idx = [
+            array('i', [self._id_to_idx[r] for r in node.related if r in self._id_to_idx])
+            for node in self._idx_to_node
+        ]
+        self._fusion_idx = [
+            array('i', [self._id_to_idx[f] for f in node.fusion_potential if f in self._id_to_idx])
+            for node in self._idx_to_node
+        ]
+        # frozenset 키로 재구성: (a, b)와 (b, a) 어느 방향으로도 한 번에 조회
+        self._bridges_fs = {frozenset(k): v for k, v in self.DOMAIN_BRIDGES.items()}
+        self._all_concepts_frozen = frozenset(self.concept_graph)
+
+    def _get_domain_bridge(self, domain_a: str, domain_b: str) -> Optional[List[str]]:
+        """두 분야를 잇는 다리 개념 조회 (순서 무관)"""
+        return self._bridges_fs.get(frozenset((domain_a, domain_b)))
 
     async def generate_path(
         self,
@@ -228,32 +304,67 @@ class LearningPathGenerator:
             max_steps: 최대 단계 수
             focus_domains: 집중할 분야들
         """
+        return self._generate_path_sync(
+            start_concept, goal, path_type, user_level, max_steps, focus_domains
+        )
+
+    async def generate_paths_batch(
+        self,
+        specs: List[Dict[str, Any]]
+    ) -> List[LearningPath]:
+        """
+        여러 경로를 병렬 생성 (추천 UI의 3-5개 옵션용)
+
+        경로 생성은 순수 CPU 작업이므로 스레드 풀로 팬아웃한다.
+
+        Args:
+            specs: generate_path 키워드 인자 dict의 리스트
+        """
+        return list(await asyncio.gather(
+            *[asyncio.to_thread(self._generate_path_sync, **spec) for spec in specs]
+        ))
+
+    def _generate_path_sync(
+        self,
+        start_concept: str,
+        goal: Optional[str] = None,
+        path_type: PathType = PathType.SPIRAL,
+        user_level: int = 2,
+        max_steps: int = 7,
+        focus_domains: Optional[List[str]] = None
+    ) -> LearningPath:
+        """generate_path의 동기 본체 (스레드 풀에서 호출 가능)"""
         # 경로 유형에 따른 생성
         if path_type == PathType.DEPTH_FIRST:
-            steps = await self._generate_depth_first(
+            steps = self._generate_depth_first(
                 start_concept, user_level, max_steps
             )
         elif path_type == PathType.BREADTH_FIRST:
-            steps = await self._generate_breadth_first(
+            steps = self._generate_breadth_first(
                 start_concept, user_level, max_steps
             )
         elif path_type == PathType.BRIDGE:
-            steps = await self._generate_bridge_path(
+            steps = self._generate_bridge_path(
                 start_concept, goal, user_level, max_steps
             )
         elif path_type == PathType.CHALLENGE:
-            steps = await self._generate_challenge_path(
+            steps = self._generate_challenge_path(
                 start_concept, user_level, max_steps
             )
         else:  # SPIRAL (기본)
-            steps = await self._generate_spiral_path(
+            steps = self._generate_spiral_path(
                 start_concept, user_level, max_steps
             )
 
-        # 경로 메타데이터 계산
-        domains = list(set(step.concept.domain for step in steps))
-        difficulties = [step.concept.difficulty.value for step in steps]
-        total_time = sum(step.estimated_time for step in steps)
+        # 경로 메타데이터 계산 — 한 번의 순회로 SoA 배열 구축
+        # dict.fromkeys: 삽입 순서 유지 + 한 번의 패스로 중복 제거 (set보다 결정적)
+        domains = list(dict.fromkeys(step.concept.domain for step in steps))
+        difficulties = array('b')
+        times = array('H')
+        for step in steps:
+            difficulties.append(step.concept.difficulty.value)
+            times.append(step.estimated_time)
+        total_time = sum(times)
 
         # 학습 목표 생성
         objectives = self._generate_objectives(steps, path_type)
@@ -268,10 +379,12 @@ class LearningPathGenerator:
             estimated_duration=total_time,
             difficulty_range=(min(difficulties), max(difficulties)),
             domains_covered=domains,
-            learning_objectives=objectives
+            learning_objectives=objectives,
+            _difficulties=difficulties,
+            _times=times
         )
 
-    async def _generate_spiral_path(
+    def _generate_spiral_path(
         self,
         start: str,
         level: int,
@@ -281,6 +394,8 @@ class LearningPathGenerator:
         steps = []
         visited = set()
         current = start
+        # 초점/시간표는 루프 밖에서 확정 (핫 패스 특화)
+        focus_schedule = _spiral_focus(max_steps)
 
         for i in range(max_steps):
             concept = self._get_concept(current)
@@ -289,20 +404,12 @@ class LearningPathGenerator:
 
             visited.add(current)
 
-            # 난이도에 따른 초점 결정
-            if i < max_steps // 3:
-                focus = "기초 이해"
-            elif i < 2 * max_steps // 3:
-                focus = "연결과 적용"
-            else:
-                focus = "심층 탐구와 종합"
-
             step = PathStep(
                 concept=concept,
-                focus=focus,
+                focus=focus_schedule[i],
                 questions=concept.key_questions[:2],
                 connections=[s.concept.name for s in steps[-2:]] if steps else [],
-                estimated_time=15 + (i * 5),  # 점진적 시간 증가
+                estimated_time=_SPIRAL_TIMES[i] if i < len(_SPIRAL_TIMES) else 15 + i * 5,
                 checkpoint=f"{concept.name}의 핵심을 한 문장으로 설명할 수 있는가?"
             )
             steps.append(step)
@@ -319,7 +426,7 @@ class LearningPathGenerator:
 
         return steps
 
-    async def _generate_depth_first(
+    def _generate_depth_first(
         self,
         start: str,
         level: int,
@@ -348,7 +455,7 @@ class LearningPathGenerator:
 
         return steps
 
-    async def _generate_breadth_first(
+    def _generate_breadth_first(
         self,
         start: str,
         level: int,
@@ -356,19 +463,18 @@ class LearningPathGenerator:
     ) -> List[PathStep]:
         """너비 우선: 넓은 연결 탐색"""
         steps = []
-        visited = set()
-        queue = [start]
+        # 정수 인덱스 + bytearray로 방문 체크 (문자열 해싱 제거)
+        # 큐 삽입 시점에 중복을 걸러 큐 크기가 그래프 크기를 넘지 않게 한다
+        visited = bytearray(len(self._id_to_idx))
+        start_idx = self._id_to_idx.get(start)
+        if start_idx is None:
+            return steps
+        visited[start_idx] = 1
+        queue = [start_idx]
 
         while queue and len(steps) < max_steps:
-            current = queue.pop(0)
-            if current in visited:
-                continue
-
-            concept = self._get_concept(current)
-            if not concept:
-                continue
-
-            visited.add(current)
+            idx = queue.pop(0)
+            concept = self._idx_to_node[idx]
 
             step = PathStep(
                 concept=concept,
@@ -380,14 +486,15 @@ class LearningPathGenerator:
             )
             steps.append(step)
 
-            # 관련 개념들을 큐에 추가
-            for related in concept.related:
-                if related not in visited:
-                    queue.append(related)
+            # 관련 개념들을 큐에 추가 (삽입 시점에 방문 표시해 중복 삽입 차단)
+            for related_idx in self._related_idx[idx]:
+                if not visited[related_idx]:
+                    visited[related_idx] = 1
+                    queue.append(related_idx)
 
         return steps
 
-    async def _generate_bridge_path(
+    def _generate_bridge_path(
         self,
         start: str,
         end: Optional[str],
@@ -411,8 +518,17 @@ class LearningPathGenerator:
             checkpoint=f"{start_concept.name}의 핵심 원리를 이해했는가?"
         ))
 
-        # 중간 다리 개념들
-        bridge_concepts = start_concept.fusion_potential[:max_steps-2]
+        # 중간 다리 개념들 (분야 간 다리가 정의되어 있으면 우선 사용)
+        bridge_concepts = None
+        if end:
+            end_concept_node = self._get_concept(end)
+            if end_concept_node:
+                bridge_concepts = self._get_domain_bridge(
+                    start_concept.domain, end_concept_node.domain
+                )
+        if bridge_concepts is None:
+            bridge_concepts = start_concept.fusion_potential
+        bridge_concepts = bridge_concepts[:max_steps-2]
         for bridge in bridge_concepts:
             bridge_node = self._get_concept(bridge) or self._create_placeholder(bridge)
             steps.append(PathStep(
@@ -438,7 +554,7 @@ class LearningPathGenerator:
 
         return steps
 
-    async def _generate_challenge_path(
+    def _generate_challenge_path(
         self,
         start: str,
         level: int,
@@ -451,21 +567,13 @@ class LearningPathGenerator:
         if not concept:
             return steps
 
-        # 난이도 높은 질문들 중심
-        challenges = [
-            ("존재론적 도전", f"{concept.name}은 실재하는가, 우리 모델인가?"),
-            ("환원 도전", f"{concept.name}을 더 기본적인 것으로 환원할 수 있는가?"),
-            ("연결 도전", f"가장 멀어 보이는 분야와 {concept.name}을 연결할 수 있는가?"),
-            ("역설 도전", f"{concept.name}과 관련된 역설을 해결할 수 있는가?"),
-            ("예측 도전", f"{concept.name}의 미래는 어떻게 될 것인가?"),
-        ]
-
-        for i, (focus, question) in enumerate(challenges[:max_steps]):
+        # 난이도 높은 질문들 중심 (템플릿은 모듈 수준, 이름만 채워넣음)
+        for i, (focus, template) in enumerate(_CHALLENGE_TEMPLATES[:max_steps]):
             step = PathStep(
                 concept=concept,
                 focus=focus,
-                questions=[question],
-                connections=[challenges[i-1][0]] if i > 0 else [],
+                questions=[template.format(n=concept.name)],
+                connections=[_CHALLENGE_TEMPLATES[i-1][0]] if i > 0 else [],
                 estimated_time=25,
                 checkpoint=f"{focus}에 대한 자신만의 답변을 제시할 수 있는가?"
             )
@@ -478,15 +586,8 @@ class LearningPathGenerator:
         return self.concept_graph.get(concept_id)
 
     def _create_placeholder(self, concept_id: str) -> ConceptNode:
-        """임시 개념 노드 생성"""
-        return ConceptNode(
-            id=concept_id,
-            name=concept_id,
-            domain="general",
-            difficulty=ConceptDifficulty.INTERMEDIATE,
-            description=f"{concept_id} 개념",
-            key_questions=[f"{concept_id}란 무엇인가?"]
-        )
+        """임시 개념 노드 생성 (id당 한 번만 할당하는 플라이웨이트)"""
+        return _make_placeholder(concept_id)
 
     def _select_by_level(self, candidates: List[str], level: int) -> str:
         """사용자 수준에 맞는 개념 선택"""
@@ -575,18 +676,26 @@ class LearningPathGenerator:
 
     async def suggest_next_path(
         self,
-        completed_concepts: List[str],
-        user_interests: List[str],
+        completed_concepts: "frozenset[str]",
+        user_interests: "frozenset[str]",
         user_level: int
     ) -> LearningPath:
-        """다음 학습 경로 추천"""
-        # 아직 탐구하지 않은 개념 찾기
-        all_concepts = set(self.concept_graph.keys())
-        unexplored = all_concepts - set(completed_concepts)
+        """다음 학습 경로 추천
+
+        호출자가 진행 상황 추적용으로 이미 들고 있는 frozenset을
+        그대로 받아, 호출마다 set을 재구축하지 않는다.
+        """
+        if not isinstance(completed_concepts, frozenset):
+            completed_concepts = frozenset(completed_concepts)
+        if not isinstance(user_interests, frozenset):
+            user_interests = frozenset(user_interests)
+
+        # 아직 탐구하지 않은 개념 찾기 (C 수준 set 차집합 한 번)
+        unexplored = self._all_concepts_frozen - completed_concepts
 
         if not unexplored:
             # 모든 개념 탐구 완료 → 더 깊은 탐구
-            start = random.choice(completed_concepts)
+            start = random.choice(tuple(completed_concepts))
             return await self.generate_path(
                 start, path_type=PathType.DEPTH_FIRST, user_level=user_level+1
             )
@@ -5,9 +5,64 @@ Claude/GPT를 활용한 맥락 인식 질문 생성
 지식 베이스와 연동하여 깊이 있는 탐구 질문 제공
 """
 
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any
 from dataclasses import dataclass
 from enum import Enum
+from collections import ChainMap, OrderedDict
+import asyncio
+import contextlib
+import json
+import re
+import textwrap
+import time
+
+from src.models.concept import Concept
+
+
+# 프리페치한 검색 결과의 유효 시간 (초)
+PREFETCH_TTL = 60.0
+
+# 보강된 지식 컨텍스트의 유효 시간 (초)과 보관 상한
+CTX_CACHE_TTL = 60.0
+CTX_CACHE_SIZE = 256
+
+# 질문 지문(fingerprint)용 — 소문자화 + 비단어 문자 제거로 표기 차이를 흡수
+_FINGERPRINT_RE = re.compile(r'\W+')
+
+# 콜드 스타트 기본 질문 (첫 사용 시 한 번만 구성)
+_COLD_START_QUESTIONS: Optional[List["GeneratedQuestion"]] = None
+
+# 프롬프트에 원문 그대로 넣는 최근 대화 턴 수 — prefill 토큰을 O(K)로 제한
+MAX_HISTORY_TURNS = 8
+
+
+def _summarize_if_long(
+    history: List[Dict[str, str]],
+    max_turns: int = MAX_HISTORY_TURNS,
+    prior_summary: Optional[str] = None
+) -> List[Dict[str, str]]:
+    """최근 max_turns개 턴만 원문 유지, 그 이전은 압축 요약 한 줄로 대체"""
+    if len(history) <= max_turns:
+        return history
+
+    if prior_summary is None:
+        older = history[:-max_turns]
+        snippets = list(dict.fromkeys(
+            turn.get("content", "")[:40] for turn in older if turn.get("content")
+        ))[:5]
+        prior_summary = f"[이전 {len(older)}턴 요약: " + " / ".join(snippets) + "]"
+
+    return [{"role": "system", "content": prior_summary}] + history[-max_turns:]
+
+# 템플릿 치환 기본값 — format_map에서 빠진 키가 있어도 실패하지 않게
+_TEMPLATE_DEFAULTS = {
+    "concept": "개념",
+    "related": "관련 개념",
+    "domain": "다른 분야",
+    "domain_a": "분야 A",
+    "domain_b": "분야 B",
+    "thinker": "해당 분야의 전문가",
+}
 
 
 class QuestionStrategy(Enum):
@@ -21,7 +76,7 @@ class QuestionStrategy(Enum):
     META = "meta"               # 메타 성찰
 
 
-@dataclass
+@dataclass(slots=True)
 class GeneratedQuestion:
     """생성된 질문"""
     question: str
@@ -32,7 +87,7 @@ class GeneratedQuestion:
     follow_ups: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class QuestionContext:
     """질문 생성 컨텍스트"""
     topic: str
@@ -42,6 +97,115 @@ class QuestionContext:
     knowledge_context: List[Dict[str, Any]]
     depth_level: int  # 1-5
     focus_areas: List[str]
+    # 오래된 턴의 누적 요약 (윈도잉 시 재계산하지 않도록 보관)
+    history_summary: Optional[str] = None
+
+
+class SemanticQuestionCache:
+    """
+    생성된 질문의 시맨틱 캐시
+
+    같은 토픽/입장이 세션을 넘어 반복되므로, 근접 중복 컨텍스트에는
+    이전에 생성한 질문을 돌려줘 LLM 호출 비용을 아낀다.
+    ChromaDB 클라이언트가 있으면 임베딩 근사 매칭, 없으면 정확 키 매칭.
+    """
+
+    COLLECTION_NAME = "polymath_question_cache"
+
+    # 정확 키 계층의 보관 상한 — 일회성 토픽이 무한히 쌓이지 않도록
+    EXACT_CACHE_SIZE = 256
+
+    def __init__(self, vector_store=None, threshold: float = 0.92, ttl: float = 3600.0):
+        self.threshold = threshold
+        self.ttl = ttl
+        self._exact: "OrderedDict[str, Any]" = OrderedDict()
+        self._collection = None
+
+        client = getattr(vector_store, "client", None)
+        if client is not None:
+            try:
+                self._collection = client.get_or_create_collection(self.COLLECTION_NAME)
+            except Exception:
+                self._collection = None
+
+    @staticmethod
+    def make_key(context: "QuestionContext", strategies: List["QuestionStrategy"]) -> str:
+        """캐시 키 — 질문 내용을 결정하는 필드만 포함"""
+        return "|".join([
+            context.topic,
+            context.user_position or "",
+            ",".join(s.value for s in strategies),
+            str(context.depth_level),
+        ])
+
+    def get(self, key: str) -> Optional[List["GeneratedQuestion"]]:
+        """근접 매칭 조회 (TTL 경과 시 미스)"""
+        now = time.monotonic()
+
+        entry = self._exact.get(key)
+        if entry:
+            ts, questions = entry
+            if now - ts <= self.ttl:
+                self._exact.move_to_end(key)
+                return questions
+            del self._exact[key]
+
+        if self._collection is not None:
+            try:
+                results = self._collection.query(
+                    query_texts=[key],
+                    n_results=1,
+                    include=["metadatas", "distances"]
+                )
+                if results and results["ids"] and results["ids"][0]:
+                    distance = results["distances"][0][0]
+                    similarity = 1.0 / (1.0 + distance)
+                    meta = results["metadatas"][0][0]
+                    if (similarity >= self.threshold
+                            and time.time() - meta.get("created_at", 0) <= self.ttl):
+                        return [
+                            GeneratedQuestion(
+                                question=q["question"],
+                                strategy=QuestionStrategy(q["strategy"]),
+                                purpose=q["purpose"],
+                                related_concepts=q["related_concepts"],
+                                difficulty=q["difficulty"],
+                                follow_ups=q["follow_ups"],
+                            )
+                            for q in json.loads(meta["questions"])
+                        ]
+            except Exception:
+                pass
+
+        return None
+
+    def put(self, key: str, questions: List["GeneratedQuestion"]) -> None:
+        """생성 결과 저장"""
+        self._exact[key] = (time.monotonic(), questions)
+        self._exact.move_to_end(key)
+        if len(self._exact) > self.EXACT_CACHE_SIZE:
+            self._exact.popitem(last=False)
+
+        if self._collection is not None:
+            try:
+                serialized = json.dumps([
+                    {
+                        "question": q.question,
+                        "strategy": q.strategy.value,
+                        "purpose": q.purpose,
+                        "related_concepts": q.related_concepts,
+                        "difficulty": q.difficulty,
+                        "follow_ups": q.follow_ups,
+                    }
+                    for q in questions
+                ], ensure_ascii=False)
+                self._collection.upsert(
+                    ids=[key],
+                    documents=[key],
+                    metadatas=[{"questions": serialized, "created_at": time.time()}]
+                )
+            except Exception:
+                pass
 
 
 class LLMQuestioner:
@@ -148,6 +312,23 @@ class LLMQuestioner:
 """
     }
 
+    # import 시점에 한 번만 정규화 — 호출마다 문자열 연산 반복 방지
+    STRATEGY_PROMPTS = {
+        strategy: textwrap.dedent(prompt).strip()
+        for strategy, prompt in STRATEGY_PROMPTS.items()
+    }
+
+    # 전략 → 소크라테스 질문 유형 (호출마다 dict를 재생성하지 않도록 클래스 상수화)
+    STRATEGY_TO_TYPE = {
+        QuestionStrategy.CLARIFY: "clarification",
+        QuestionStrategy.CHALLENGE: "assumption",
+        QuestionStrategy.EXPAND: "viewpoint",
+        QuestionStrategy.CONNECT: "bridge",
+        QuestionStrategy.DEEPEN: "implication",
+        QuestionStrategy.SYNTHESIZE: "viewpoint",
+        QuestionStrategy.META: "meta"
+    }
+
     # 7가지 소크라테스 질문 유형 매핑
     SOCRATIC_TYPES = {
         "clarification": {
@@ -215,21 +396,74 @@ class LLMQuestioner:
         }
     }
 
-    def __init__(self, rag_pipeline, llm_client=None):
+    # 프로세스 전체에서 불변인 "소크라테스 매뉴얼" — 공급자 프리픽스 캐시에
+    # 한 번만 올라가도록 정규화된 단일 JSON 블록으로 직렬화
+    SOCRATIC_MANUAL = json.dumps(
+        {
+            "strategy_prompts": {s.value: p for s, p in STRATEGY_PROMPTS.items()},
+            "socratic_types": SOCRATIC_TYPES,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+
+    def __init__(self, rag_pipeline, llm_client=None, latency_mode: str = "optimized"):
         """
         Args:
             rag_pipeline: RAG 검색 파이프라인
             llm_client: LLM API 클라이언트 (선택, 없으면 템플릿 기반)
+            latency_mode: "optimized"면 공급자의 저지연 추론 경로 사용
         """
         self.rag = rag_pipeline
         self.llm = llm_client
+        self.latency_mode = latency_mode
         self.use_llm = llm_client is not None
+        # LLM 공급자 동시 호출 상한
+        self._llm_semaphore = asyncio.Semaphore(8)
+        # 토픽별 프리페치 태스크: topic -> (시작 시각, task)
+        self._prefetch_tasks: Dict[str, Any] = {}
+        # 생성 질문 시맨틱 캐시
+        self.question_cache = SemanticQuestionCache(
+            getattr(rag_pipeline, "vector_store", None)
+        )
+        # (topic, focus_areas) → (시각, knowledge_context) TTL LRU
+        self._ctx_cache: "OrderedDict[Any, Any]" = OrderedDict()
+
+    def prefetch(self, topic: str) -> None:
+        """
+        토픽이 보이는 즉시 RAG 검색을 미리 시작 (논블로킹)
+
+        MCP 툴 핸들러가 QuestionContext를 다 만들기 전에 호출하면
+        검색이 전략 선택과 겹쳐 첫 질문 지연이 줄어든다.
+        """
+        now = time.monotonic()
+        # TTL이 지난 항목 정리
+        for key in [k for k, (ts, _) in self._prefetch_tasks.items()
+                    if now - ts > PREFETCH_TTL]:
+            _, stale = self._prefetch_tasks.pop(key)
+            stale.cancel()
+
+        if topic not in self._prefetch_tasks:
+            task = asyncio.create_task(self.rag.search(query=topic, limit=5))
+            self._prefetch_tasks[topic] = (now, task)
+
+    async def _search_topic(self, topic: str) -> List[Any]:
+        """프리페치 결과가 있으면 그것을, 없으면 새 검색을 사용"""
+        entry = self._prefetch_tasks.pop(topic, None)
+        if entry:
+            ts, task = entry
+            if time.monotonic() - ts <= PREFETCH_TTL and not task.cancelled():
+                return await task
+            task.cancel()
+        return await self.rag.search(query=topic, limit=5)
 
     async def generate_questions(
         self,
         context: QuestionContext,
         num_questions: int = 3,
-        strategies: Optional[List[QuestionStrategy]] = None
+        strategies: Optional[List[QuestionStrategy]] = None,
+        use_cache: bool = True,
+        fast_path: bool = False
     ) -> List[GeneratedQuestion]:
         """
         컨텍스트 기반 소크라테스 질문 생성
@@ -238,31 +472,123 @@ class LLMQuestioner:
             context: 질문 생성 컨텍스트
             num_questions: 생성할 질문 수
             strategies: 사용할 전략 (없으면 자동 선택)
+            use_cache: 시맨틱 캐시 사용 여부 (다양성이 중요하면 False)
+            fast_path: True면 지식 보강을 생략 (RAG 왕복 없음)
 
         Returns:
             생성된 질문 목록
         """
+        # 0. 콜드 스타트: 토픽이 없으면 RAG를 건드리지 않고 기본 질문 반환
+        if not context.topic or not context.topic.strip():
+            return self._cold_start_questions()
+
         # 1. 전략 선택
         if not strategies:
             strategies = await self._select_strategies(context)
 
-        # 2. 지식 컨텍스트 보강
-        enriched_context = await self._enrich_context(context)
-
-        # 3. 질문 생성
-        questions = []
-        for strategy in strategies[:num_questions]:
-            if self.use_llm:
-                q = await self._generate_with_llm(enriched_context, strategy)
-            else:
-                q = await self._generate_from_template(enriched_context, strategy)
-            questions.append(q)
+        # 1.5 시맨틱 캐시 조회 — 히트 시 생성/검색 전부 생략
+        cache_key = SemanticQuestionCache.make_key(context, strategies[:num_questions])
+        if use_cache:
+            cached = self.question_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        # 2. 지식 컨텍스트 보강 (fast_path면 생략)
+        enriched_context = context if fast_path else await self._enrich_context(context)
+
+        # 3. 질문 생성 — LLM 모드면 전략 N개를 한 번의 호출로 배칭,
+        #    실패하거나 템플릿 모드면 전략별 동시 실행으로 폴백
+        questions = None
+        if self.use_llm:
+            questions = await self._generate_batch(
+                enriched_context, strategies[:num_questions]
+            )
+        if questions is None:
+            generate = self._generate_with_llm if self.use_llm else self._generate_from_template
+            questions = list(await asyncio.gather(
+                *[generate(enriched_context, strategy) for strategy in strategies[:num_questions]]
+            ))
 
         # 4. 질문 정제 및 순서화
         questions = self._refine_questions(questions, context)
 
+        if use_cache:
+            self.question_cache.put(cache_key, questions)
+
         return questions
 
+    def _cold_start_questions(self) -> List[GeneratedQuestion]:
+        """토픽이 비어 있을 때의 기본 질문 — 첫 호출 때 한 번만 구성"""
+        global _COLD_START_QUESTIONS
+        if _COLD_START_QUESTIONS is None:
+            # 치환 변수가 없는 유형들만 사용 (토픽 없이도 성립하는 질문)
+            _COLD_START_QUESTIONS = [
+                GeneratedQuestion(
+                    question=self.SOCRATIC_TYPES[q_type]["templates"][0],
+                    strategy=strategy,
+                    purpose=self.SOCRATIC_TYPES[q_type]["name"],
+                    related_concepts=[],
+                    difficulty=1,
+                    follow_ups=[]
+                )
+                for q_type, strategy in (
+                    ("meta", QuestionStrategy.META),
+                    ("assumption", QuestionStrategy.CHALLENGE),
+                    ("evidence", QuestionStrategy.DEEPEN),
+                )
+            ]
+        return list(_COLD_START_QUESTIONS)
+
+    async def stream_questions(
+        self,
+        context: QuestionContext,
+        num_questions: int = 3,
+        strategies: Optional[List[QuestionStrategy]] = None,
+        use_cache: bool = True
+    ) -> AsyncIterator[GeneratedQuestion]:
+        """
+        질문을 완성되는 순서대로 스트리밍
+
+        generate_questions와 달리 전체가 끝나기를 기다리지 않으므로
+        첫 질문의 체감 지연이 가장 빠른 전략의 지연으로 줄어든다.
+        지문 기반 중복 제거와 시맨틱 캐시는 여기서도 적용되며,
+        난이도 순서화만 호출자 몫이다.
+        """
+        if not strategies:
+            strategies = await self._select_strategies(context)
+
+        # 시맨틱 캐시 히트면 생성 없이 그대로 흘려보낸다
+        cache_key = SemanticQuestionCache.make_key(
+            context, strategies[:num_questions]
+        )
+        if use_cache:
+            cached = self.question_cache.get(cache_key)
+            if cached is not None:
+                for question in cached:
+                    yield question
+                return
+
+        enriched_context = await self._enrich_context(context)
+
+        generate = self._generate_with_llm if self.use_llm else self._generate_from_template
+        pending = [
+            generate(enriched_context, strategy)
+            for strategy in strategies[:num_questions]
+        ]
+        # 이미 내보낸 지문은 건너뛴다 — 템플릿 경로는 전략이 달라도
+        # 같은 문장을 만들 수 있다 (_refine_questions와 같은 기준)
+        emitted: Dict[str, GeneratedQuestion] = {}
+        for future in asyncio.as_completed(pending):
+            question = await future
+            fingerprint = _FINGERPRINT_RE.sub('', question.question.lower())
+            if fingerprint in emitted:
+                continue
+            emitted[fingerprint] = question
+            yield question
+
+        if use_cache and emitted:
+            self.question_cache.put(cache_key, list(emitted.values()))
+
     async def _select_strategies(
         self,
         context: QuestionContext
@@ -308,19 +634,40 @@ class LLMQuestioner:
         """
         RAG를 통해 컨텍스트 보강
         """
-        # 지식 베이스에서 관련 정보 검색
-        knowledge_results = await self.rag.search(
-            query=context.topic,
-            limit=5
-        )
-
-        # 연결 가능한 다른 분야 개념 검색
+        # 호출자가 이미 충분한 컨텍스트를 넘겼으면 검색 생략
+        if context.knowledge_context and len(context.knowledge_context) >= 3:
+            return context
+
+        # 같은 토픽/포커스로 최근에 보강했으면 재사용
+        cache_key = (context.topic, tuple(context.focus_areas or ()))
+        entry = self._ctx_cache.get(cache_key)
+        if entry is not None:
+            if time.monotonic() - entry[0] <= CTX_CACHE_TTL:
+                self._ctx_cache.move_to_end(cache_key)
+                context.knowledge_context = entry[1]
+                return context
+            # 만료 항목은 읽기 시점에 바로 제거 (무한 성장 방지)
+            del self._ctx_cache[cache_key]
+
+        # 두 검색을 투기적으로 동시에 시작 — 타 분야 검색 결과는
+        # user_position이 없는 것으로 판명되면 그냥 버린다
+        search_task = asyncio.create_task(self._search_topic(context.topic))
+        meta_task = asyncio.create_task(self.rag.search_metaphorical(
+            concept=Concept(id=context.topic, name=context.topic, domain="general"),
+            target_domains=None  # 모든 분야
+        ))
+
+        knowledge_results = await search_task
         if context.user_position:
-            cross_domain = await self.rag.search_metaphorical(
-                concept=context.topic,
-                target_domains=None  # 모든 분야
-            )
-            knowledge_results.extend(cross_domain[:3])
+            try:
+                cross_domain = await meta_task
+                knowledge_results.extend(cross_domain[:3])
+            except Exception:
+                pass
+        else:
+            meta_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await meta_task
 
         # 컨텍스트 업데이트
         context.knowledge_context = [
@@ -331,6 +678,10 @@ class LLMQuestioner:
             }
             for r in knowledge_results
         ]
+        self._ctx_cache[cache_key] = (time.monotonic(), context.knowledge_context)
+        self._ctx_cache.move_to_end(cache_key)
+        if len(self._ctx_cache) > CTX_CACHE_SIZE:
+            self._ctx_cache.popitem(last=False)
 
         return context
 
@@ -340,11 +691,145 @@ class LLMQuestioner:
         strategy: QuestionStrategy
     ) -> GeneratedQuestion:
         """
-        LLM을 사용한 질문 생성 (향후 구현)
+        LLM을 사용한 질문 생성
+        """
+        # LLM API 호출 로직 — 동시 호출 수를 세마포어로 제한
+        async with self._llm_semaphore:
+            if self.llm is not None:
+                try:
+                    request = self._build_llm_request(context, strategy)
+                    response = await self.llm.messages.create(**request)
+                    text = response.content[0].text.strip()
+                    if text:
+                        return GeneratedQuestion(
+                            question=text,
+                            strategy=strategy,
+                            purpose=strategy.value,
+                            related_concepts=[
+                                kc["name"] for kc in context.knowledge_context[:3]
+                            ],
+                            difficulty=context.depth_level,
+                            follow_ups=[]
+                        )
+                except Exception:
+                    pass
+            # 클라이언트 미설정/호출 실패 시 템플릿 기반으로 폴백
+            return await self._generate_from_template(context, strategy)
+
+    async def _generate_batch(
+        self,
+        context: QuestionContext,
+        strategies: List[QuestionStrategy]
+    ) -> Optional[List[GeneratedQuestion]]:
+        """
+        전략 N개를 단일 LLM 호출로 묶어 생성
+
+        토픽/컨텍스트가 동일하므로 N번의 왕복 대신 JSON 배열 하나를
+        요청한다. 파싱에 실패하면 None을 반환해 전략별 호출로 폴백.
+        """
+        if self.llm is None or not strategies:
+            return None
+
+        try:
+            request = self._build_llm_request(context, strategies[0])
+            request["messages"] = [{
+                "role": "user",
+                "content": (
+                    f"{request['messages'][0]['content']}\n\n"
+                    f"다음 전략 각각에 대해 질문을 하나씩 생성하세요: "
+                    f"{[s.value for s in strategies]}\n"
+                    '결과는 JSON 배열로만 출력하세요. 각 원소: '
+                    '{"question": str, "strategy": str, "purpose": str, '
+                    '"related_concepts": [str], "difficulty": int, "follow_ups": [str]}'
+                )
+            }]
+            # 질문 N개 분량
+            request["max_tokens"] = 200 * len(strategies)
+
+            async with self._llm_semaphore:
+                response = await self.llm.messages.create(**request)
+
+            parsed = json.loads(response.content[0].text)
+            questions = [
+                GeneratedQuestion(
+                    question=item["question"],
+                    strategy=QuestionStrategy(item["strategy"]),
+                    purpose=item.get("purpose", ""),
+                    related_concepts=item.get("related_concepts", []),
+                    difficulty=int(item.get("difficulty", context.depth_level)),
+                    follow_ups=item.get("follow_ups", []),
+                )
+                for item in parsed
+            ]
+            return questions if questions else None
+        except Exception:
+            return None
+
+    def _build_llm_request(
+        self,
+        context: QuestionContext,
+        strategy: QuestionStrategy
+    ) -> Dict[str, Any]:
+        """
+        프롬프트 캐시 친화적 요청 구성
+
+        긴 정적 블록(전략 프롬프트, 세션 내 안정적인 지식 컨텍스트)을
+        cache_control이 달린 선행 system 블록으로 두고, 매 턴 바뀌는
+        필드만 마지막 user 메시지에 넣는다. 지식 컨텍스트는 정렬 키로
+        직렬화해 호출 간 바이트 단위로 동일한 프리픽스가 반복되게 한다.
         """
-        # LLM API 호출 로직
-        # 현재는 템플릿 기반으로 폴백
-        return await self._generate_from_template(context, strategy)
+        knowledge_block = json.dumps(
+            context.knowledge_context,
+            sort_keys=True,
+            ensure_ascii=False,
+            separators=(",", ":")
+        )
+        # 히스토리는 최근 K턴 + 요약으로 윈도잉 (prefill 비용 상한)
+        windowed_history = _summarize_if_long(
+            context.dialogue_history,
+            prior_summary=context.history_summary
+        )
+        if windowed_history and windowed_history is not context.dialogue_history:
+            context.history_summary = windowed_history[0]["content"]
+
+        dynamic_turn = json.dumps(
+            {
+                "topic": context.topic,
+                "user_position": context.user_position,
+                "explored_concepts": context.explored_concepts,
+                "depth_level": context.depth_level,
+                "dialogue_history": windowed_history,
+            },
+            ensure_ascii=False
+        )
+        request = {
+            "system": [
+                # 가장 안정적인 블록부터: 매뉴얼(프로세스 불변) →
+                # 전략 프롬프트(전략별 불변) → 지식 컨텍스트(세션 수준)
+                {
+                    "type": "text",
+                    "text": self.SOCRATIC_MANUAL,
+                    "cache_control": {"type": "ephemeral"}
+                },
+                {
+                    "type": "text",
+                    "text": self.STRATEGY_PROMPTS[strategy],
+                    "cache_control": {"type": "ephemeral"}
+                },
+                {
+                    "type": "text",
+                    "text": knowledge_block,
+                    "cache_control": {"type": "ephemeral"}
+                },
+            ],
+            "messages": [{"role": "user", "content": dynamic_turn}],
+            # 질문 하나 분량이면 충분 — 큰 기본값은 지연만 키운다
+            "max_tokens": 200,
+        }
+        if self.latency_mode == "optimized":
+            # Bedrock식 저지연 추론 플래그 (지원하지 않는 공급자는 무시)
+            request["extra_body"] = {"performanceConfig": {"latency": "optimized"}}
+        return request
 
     async def _generate_from_template(
         self,
@@ -354,32 +839,22 @@ class LLMQuestioner:
         """
         템플릿 기반 질문 생성
         """
-        # 전략에 따른 질문 유형 매핑
-        strategy_to_type = {
-            QuestionStrategy.CLARIFY: "clarification",
-            QuestionStrategy.CHALLENGE: "assumption",
-            QuestionStrategy.EXPAND: "viewpoint",
-            QuestionStrategy.CONNECT: "bridge",
-            QuestionStrategy.DEEPEN: "implication",
-            QuestionStrategy.SYNTHESIZE: "viewpoint",
-            QuestionStrategy.META: "meta"
-        }
-
-        q_type = strategy_to_type.get(strategy, "clarification")
+        q_type = self.STRATEGY_TO_TYPE.get(strategy, "clarification")
         type_info = self.SOCRATIC_TYPES[q_type]
 
         # 템플릿에서 질문 생성
         template = type_info["templates"][0]  # 첫 번째 템플릿 사용
 
-        # 변수 치환
-        question = template.format(
-            concept=context.topic,
-            related=context.explored_concepts[0] if context.explored_concepts else "관련 개념",
-            domain=context.knowledge_context[0]["domain"] if context.knowledge_context else "다른 분야",
-            domain_a=context.knowledge_context[0]["domain"] if context.knowledge_context else "분야 A",
-            domain_b=context.knowledge_context[1]["domain"] if len(context.knowledge_context) > 1 else "분야 B",
-            thinker="해당 분야의 전문가"
-        )
+        # 변수 치환 — 실제 값만 채우고 나머지는 기본값에 위임
+        overrides = {"concept": context.topic}
+        if context.explored_concepts:
+            overrides["related"] = context.explored_concepts[0]
+        if context.knowledge_context:
+            overrides["domain"] = context.knowledge_context[0]["domain"]
+            overrides["domain_a"] = context.knowledge_context[0]["domain"]
+            if len(context.knowledge_context) > 1:
+                overrides["domain_b"] = context.knowledge_context[1]["domain"]
+        question = template.format_map(ChainMap(overrides, _TEMPLATE_DEFAULTS))
 
         # 지식 컨텍스트 기반 관련 개념 추출
         related_concepts = [
@@ -410,21 +885,17 @@ class LLMQuestioner:
         """
         생성된 질문 정제 및 순서화
         """
-        # 난이도 순 정렬 (낮은 것부터)
-        questions.sort(key=lambda q: q.difficulty)
-
-        # 중복 제거
-        seen = set()
-        unique_questions = []
+        # 지문 기반 중복 제거: 구두점/공백만 다른 준중복도 걸러낸다
+        seen: Dict[str, GeneratedQuestion] = {}
         for q in questions:
-            if q.question not in seen:
-                seen.add(q.question)
-                unique_questions.append(q)
+            fingerprint = _FINGERPRINT_RE.sub('', q.question.lower())
+            seen.setdefault(fingerprint, q)
 
-        return unique_questions
+        # 난이도 순 정렬 (낮은 것부터)
+        return sorted(seen.values(), key=lambda q: q.difficulty)
 
 
 # 전역 질문 생성기 팩토리
-def create_questioner(rag_pipeline, llm_client=None) -> LLMQuestioner:
+def create_questioner(rag_pipeline, llm_client=None, latency_mode: str = "optimized") -> LLMQuestioner:
     """질문 생성기 생성"""
-    return LLMQuestioner(rag_pipeline, llm_client)
+    return LLMQuestioner(rag_pipeline, llm_client, latency_mode=latency_mode)
@@ -5,13 +5,46 @@ ChromaDB (벡터) 기반 검색 (Neo4j 옵션)
 """
 
 from typing import List, Optional, Any, Dict
+from collections import OrderedDict
 from dataclasses import dataclass
+import asyncio
+import hashlib
+import heapq
 import os
 import sys
+import time
 
 from src.models.concept import Concept, ConceptLineage
 from src.models.fusion import FusionCase
 
+# RRF 상수와 순위별 가중치 (핫 루프에서 나눗셈 제거)
+RRF_K = 60
+_RRF_WEIGHTS = tuple(1.0 / (RRF_K + rank + 1) for rank in range(256))
+
+# 이보다 많은 후보를 융합할 때는 이벤트 루프를 막지 않도록 스레드로 오프로드
+_FUSE_INLINE_THRESHOLD = 64
+
+# 쿼리 임베딩 LRU 캐시 크기
+_EMBED_CACHE_SIZE = 512
+
+# 검색 결과 TTL LRU 캐시 (소크라테스 대화는 같은 토픽을 반복 검색한다)
+_SEARCH_CACHE_SIZE = 512
+_SEARCH_CACHE_TTL = 300.0  # 초
+
+# 도메인 간 거리 캐시 TTL — 도메인 집합은 작고 천천히 변한다
+_DOMAIN_DIST_TTL = 600.0  # 초
+
+
+async def _noop():
+    """gather에서 건너뛸 자리를 채우는 no-op 코루틴"""
+    return None
+
+
+def _result_id(result: Any) -> str:
+    """결과 객체의 식별자 추출 (hasattr 중복 호출 회피)"""
+    rid = getattr(result, "id", None)
+    return rid if rid is not None else str(result)
+
 
 @dataclass
 class SearchResult:
@@ -34,20 +67,61 @@ class RAGPipeline:
         self.graph_store = None   # Neo4jStore (optional)
         self.initialized = False
         self.use_graph = False
+        # 쿼리 텍스트 → 임베딩 LRU (같은 토픽 재검색 시 임베딩 계산 제거)
+        self._embedding_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._embedding_lock = asyncio.Lock()
+        # (query, domains, limit) → 검색 결과 TTL LRU
+        self._search_cache: "OrderedDict[bytes, tuple]" = OrderedDict()
+        # 정렬된 (id, id) 쌍 → 신규성 점수 LRU (대화 내 동일 쌍 재평가 제거)
+        self._novelty_cache: "OrderedDict[tuple, float]" = OrderedDict()
+        # 정렬된 (domain, domain) 쌍 → (거리, 만료 시각)
+        self._domain_dist_cache: Dict[tuple, tuple] = {}
+        # 코퍼스 변경 시 함께 비워야 하는 외부 캐시의 콜백들
+        self._invalidation_hooks: List[Any] = []
+
+    def register_invalidation_hook(self, hook):
+        """invalidate_cache 시 함께 호출할 콜백 등록 (인자 없는 callable)"""
+        self._invalidation_hooks.append(hook)
+
+    async def _embed_query(self, text: str) -> Optional[List[float]]:
+        """쿼리 임베딩 조회 (LRU 캐시 경유)"""
+        async with self._embedding_lock:
+            if text in self._embedding_cache:
+                self._embedding_cache.move_to_end(text)
+                return self._embedding_cache[text]
+
+        embed = getattr(self.vector_store, "embed", None)
+        if embed is None:
+            return None
+        embedding = await embed(text)
+        if embedding is None:
+            return None
+
+        async with self._embedding_lock:
+            self._embedding_cache[text] = embedding
+            if len(self._embedding_cache) > _EMBED_CACHE_SIZE:
+                self._embedding_cache.popitem(last=False)
+        return embedding
 
     async def initialize(self):
         """데이터베이스 연결 초기화"""
         from src.data.chroma_store import ChromaStore
 
         # Initialize vector store (required)
-        self.vector_store = ChromaStore(self.settings)
+        self.vector_store = ChromaStore(
+            self.settings,
+            pool_size=getattr(self.settings, "chroma_pool_size", None)
+        )
         await self.vector_store.initialize()
 
         # Try to initialize graph store (optional)
         try:
             if os.getenv("USE_NEO4J", "false").lower() == "true":
                 from src.data.neo4j_store import Neo4jStore
-                self.graph_store = Neo4jStore(self.settings)
+                self.graph_store = Neo4jStore(
+                    self.settings,
+                    pool_size=getattr(self.settings, "neo4j_pool_size", None)
+                )
                 await self.graph_store.initialize()
                 self.use_graph = True
                 print("Neo4j graph store initialized", file=sys.stderr)
@@ -59,6 +133,15 @@ class RAGPipeline:
         self.initialized = True
         print(f"RAG Pipeline initialized (graph={self.use_graph})", file=sys.stderr)
 
+    async def aclose(self):
+        """커넥션 풀 정리"""
+        if self.graph_store:
+            try:
+                await self.graph_store.close()
+            except Exception:
+                pass
+        self.initialized = False
+
     async def search(
         self,
         query: str,
@@ -76,28 +159,86 @@ class RAGPipeline:
         Returns:
             검색된 개념 목록
         """
-        # 1. Vector search (semantic similarity) - always available
-        vector_results = await self.vector_store.search(
-            query=query,
-            domains=domains,
-            limit=limit * 2 if self.use_graph else limit
-        )
+        # 동일 (query, domains, limit) 재검색은 임베딩 + KNN을 모두 건너뛴다
+        key = hashlib.blake2b(
+            f"{query}|{sorted(domains) if domains else []}|{limit}".encode("utf-8"),
+            digest_size=16
+        ).digest()
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            ts, results = cached
+            if time.monotonic() - ts < _SEARCH_CACHE_TTL:
+                self._search_cache.move_to_end(key)
+                return list(results)
+            del self._search_cache[key]
+
+        results = await self._search_uncached(query, domains, limit)
+
+        self._search_cache[key] = (time.monotonic(), results)
+        if len(self._search_cache) > _SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
+        return list(results)
+
+    def invalidate_cache(self):
+        """검색 결과/도메인 거리 캐시 무효화 (문서 추가 등 코퍼스 변경 시)"""
+        self._search_cache.clear()
+        self._domain_dist_cache.clear()
+        for hook in self._invalidation_hooks:
+            try:
+                hook()
+            except Exception:
+                # 외부 캐시 비우기는 최적화일 뿐 — 인제스트를 막지 않는다
+                pass
+
+    async def _search_uncached(
+        self,
+        query: str,
+        domains: Optional[List[str]] = None,
+        limit: int = 10
+    ) -> List[Concept]:
+        """캐시를 거치지 않는 실제 하이브리드 검색"""
+        # 캐시된 쿼리 임베딩 재사용 (미지원 스토어면 None → 텍스트 검색)
+        query_embedding = await self._embed_query(query)
 
-        # 2. Graph search (relationship-based) - optional
+        # Hybrid: vector + graph are independent round-trips, overlap them
         if self.use_graph and self.graph_store:
-            try:
-                graph_results = await self.graph_store.search(
+            vector_results, graph_results = await asyncio.gather(
+                self.vector_store.search(
+                    query=query,
+                    domains=domains,
+                    limit=limit * 2,
+                    query_embedding=query_embedding
+                ),
+                self.graph_store.search(
                     query=query,
                     domains=domains,
                     limit=limit * 2
+                ),
+                return_exceptions=True
+            )
+            if isinstance(vector_results, BaseException):
+                raise vector_results
+            if isinstance(graph_results, BaseException):
+                print(f"Graph search failed, using vector only: {graph_results}", file=sys.stderr)
+                return vector_results[:limit]
+
+            # Fuse results using RRF — 작은 융합은 인라인, 큰 융합은
+            # numpy SoA 경로를 스레드에서 실행
+            if len(vector_results) + len(graph_results) < _FUSE_INLINE_THRESHOLD:
+                fused = self._fuse_results(vector_results, graph_results, limit)
+            else:
+                fused = await asyncio.to_thread(
+                    self._fuse_results_numpy, vector_results, graph_results, limit
                 )
-                # Fuse results using RRF
-                fused = self._fuse_results(vector_results, graph_results)
-                return fused[:limit]
-            except Exception as e:
-                print(f"Graph search failed, using vector only: {e}", file=sys.stderr)
+            return fused[:limit]
 
         # Vector only
+        vector_results = await self.vector_store.search(
+            query=query,
+            domains=domains,
+            limit=limit,
+            query_embedding=query_embedding
+        )
         return vector_results[:limit]
 
     async def search_by_name(
@@ -125,15 +266,21 @@ class RAGPipeline:
 
     async def get_concept(self, concept_id: str) -> Optional[Concept]:
         """단일 개념 조회"""
-        concept = await self.vector_store.get(concept_id)
-        if concept and self.use_graph and self.graph_store:
-            try:
-                relationships = await self.graph_store.get_relationships(concept_id)
+        if self.use_graph and self.graph_store:
+            # 관계 조회를 투기적으로 같이 시작 (개념이 없으면 결과만 버림)
+            concept, relationships = await asyncio.gather(
+                self.vector_store.get(concept_id),
+                self.graph_store.get_relationships(concept_id),
+                return_exceptions=True
+            )
+            if isinstance(concept, BaseException):
+                raise concept
+            if concept and not isinstance(relationships, BaseException):
                 concept.related_concepts = relationships.get("related", [])
                 concept.bridge_domains = relationships.get("bridges", [])
-            except:
-                pass
-        return concept
+            return concept
+
+        return await self.vector_store.get(concept_id)
 
     async def get_lineage(
         self,
@@ -141,21 +288,31 @@ class RAGPipeline:
         direction: str = "both"
     ) -> ConceptLineage:
         """개념의 지적 계보 조회"""
-        concept = await self.get_concept(concept_id)
-
         ancestors = []
         descendants = []
         key_influences = ""
 
         if self.use_graph and self.graph_store:
-            try:
-                if direction in ["ancestors", "both"]:
-                    ancestors = await self.graph_store.get_ancestors(concept_id)
-                if direction in ["descendants", "both"]:
-                    descendants = await self.graph_store.get_descendants(concept_id)
-                key_influences = await self.graph_store.get_key_influences(concept_id)
-            except:
-                pass
+            # 개념 + 계보 조회를 모두 동시에 실행 (각각 독립적인 DB 왕복)
+            concept, ancestors_r, descendants_r, influences_r = await asyncio.gather(
+                self.get_concept(concept_id),
+                self.graph_store.get_ancestors(concept_id)
+                if direction in ["ancestors", "both"] else _noop(),
+                self.graph_store.get_descendants(concept_id)
+                if direction in ["descendants", "both"] else _noop(),
+                self.graph_store.get_key_influences(concept_id),
+                return_exceptions=True
+            )
+            if isinstance(concept, BaseException):
+                raise concept
+            if ancestors_r and not isinstance(ancestors_r, BaseException):
+                ancestors = ancestors_r
+            if descendants_r and not isinstance(descendants_r, BaseException):
+                descendants = descendants_r
+            if influences_r and not isinstance(influences_r, BaseException):
+                key_influences = influences_r
+        else:
+            concept = await self.get_concept(concept_id)
 
         return ConceptLineage(
             concept=concept,
@@ -253,13 +410,30 @@ class RAGPipeline:
         domain_a: str,
         domain_b: str
     ) -> float:
-        """두 도메인 간 거리 계산 (0=같음, 1=매우 다름)"""
+        """두 도메인 간 거리 계산 (0=같음, 1=매우 다름)
+
+        거리는 대칭이고 도메인 집합은 작으므로, N² 쌍별 분석 루프가
+        그래프 쿼리 대신 딕셔너리 조회로 끝나게 TTL 캐시를 둔다.
+        """
+        pair = (domain_a, domain_b) if domain_a <= domain_b \
+            else (domain_b, domain_a)
+        cached = self._domain_dist_cache.get(pair)
+        if cached is not None and time.monotonic() < cached[1]:
+            return cached[0]
+
+        distance = 0.5  # Default moderate distance
         if self.use_graph and self.graph_store:
             try:
-                return await self.graph_store.get_domain_distance(domain_a, domain_b)
+                distance = await self.graph_store.get_domain_distance(
+                    domain_a, domain_b
+                )
             except:
                 pass
-        return 0.5  # Default moderate distance
+
+        self._domain_dist_cache[pair] = (
+            distance, time.monotonic() + _DOMAIN_DIST_TTL
+        )
+        return distance
 
     async def calculate_concept_novelty(
         self,
@@ -267,6 +441,27 @@ class RAGPipeline:
         concept_b: Concept
     ) -> float:
         """두 개념 융합의 신규성 계산"""
+        # 신규성은 대칭 — 정렬된 쌍을 키로 캐시부터 확인
+        pair = (concept_a.id, concept_b.id) if concept_a.id <= concept_b.id \
+            else (concept_b.id, concept_a.id)
+        cached = self._novelty_cache.get(pair)
+        if cached is not None:
+            self._novelty_cache.move_to_end(pair)
+            return cached
+
+        novelty = await self._calculate_novelty_uncached(concept_a, concept_b)
+
+        self._novelty_cache[pair] = novelty
+        if len(self._novelty_cache) > 4096:
+            self._novelty_cache.popitem(last=False)
+        return novelty
+
+    async def _calculate_novelty_uncached(
+        self,
+        concept_a: Concept,
+        concept_b: Concept
+    ) -> float:
+        """캐시를 거치지 않는 실제 신규성 계산"""
         # Check for existing connections in graph
         if self.use_graph and self.graph_store:
             try:
@@ -280,14 +475,96 @@ class RAGPipeline:
 
         # Check semantic similarity
         if concept_a.embedding and concept_b.embedding:
-            similarity = await self.vector_store.calculate_similarity(
-                concept_a.embedding,
-                concept_b.embedding
-            )
+            # int8 경로: 1/4 대역폭, 코사인 기준 <1% 오차 (설정으로 게이트)
+            if getattr(self.settings, "use_int8_embeddings", False):
+                for c in (concept_a, concept_b):
+                    if c.embedding_int8 is None:
+                        c.quantize_embedding()
+                if concept_a.embedding_int8 and concept_b.embedding_int8:
+                    similarity = await self.vector_store.cosine_int8(
+                        concept_a.embedding_int8,
+                        concept_b.embedding_int8
+                    )
+                    return 1.0 - similarity
+
+            # 임베딩이 이미 손에 있으면 코루틴 홉 없이 로컬에서 계산
+            try:
+                import numpy as np
+                a = np.asarray(concept_a.embedding)
+                b = np.asarray(concept_b.embedding)
+                similarity = float(
+                    np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))
+                )
+            except ImportError:
+                similarity = await self.vector_store.calculate_similarity(
+                    concept_a.embedding,
+                    concept_b.embedding
+                )
             return 1.0 - similarity
 
         return 0.7  # Default moderate novelty
 
+    @staticmethod
+    def _cosine_batch(query_emb, mat):
+        """쿼리 임베딩 대 (N, d) 행렬의 코사인 유사도 — BLAS 한 번에"""
+        import numpy as np
+
+        q = np.asarray(query_emb, dtype=np.float32)
+        m = np.asarray(mat, dtype=np.float32)
+        denom = np.linalg.norm(m, axis=1) * np.linalg.norm(q)
+        return (m @ q) / np.maximum(denom, 1e-12)
+
+    @staticmethod
+    def _cosine_batch_int8(query_int8, mat_int8):
+        """int8 양자화 버전 — 1/4 대역폭, 코사인은 스케일 불변"""
+        import numpy as np
+
+        q = np.asarray(query_int8, dtype=np.int8).astype(np.int32)
+        m = np.asarray(mat_int8, dtype=np.int8).astype(np.int32)
+        denom = np.sqrt((m * m).sum(axis=1)) * np.sqrt((q * q).sum())
+        return (m @ q) / np.maximum(denom, 1e-12)
+
+    async def calculate_concept_novelty_batch(
+        self,
+        concept: Concept,
+        candidates: List[Concept]
+    ) -> List[float]:
+        """한 개념 대 다수 후보의 신규성 일괄 계산
+
+        모든 임베딩이 준비돼 있으면 per-쌍 await 대신 matmul 1회로 처리.
+        아니면 기존 쌍별 경로로 폴백.
+        """
+        if (
+            concept.embedding
+            and candidates
+            and all(c.embedding for c in candidates)
+        ):
+            try:
+                if getattr(self.settings, "use_int8_embeddings", False):
+                    for c in (concept, *candidates):
+                        if c.embedding_int8 is None:
+                            c.quantize_embedding()
+                    if concept.embedding_int8 and \
+                            all(c.embedding_int8 for c in candidates):
+                        sims = self._cosine_batch_int8(
+                            concept.embedding_int8,
+                            [c.embedding_int8 for c in candidates]
+                        )
+                        return [1.0 - float(s) for s in sims]
+
+                sims = self._cosine_batch(
+                    concept.embedding,
+                    [c.embedding for c in candidates]
+                )
+                return [1.0 - float(s) for s in sims]
+            except ImportError:
+                pass
+
+        return [
+            await self.calculate_concept_novelty(concept, c)
+            for c in candidates
+        ]
+
     async def extract_concept_structure(self, concept: Concept) -> dict:
         """개념의 구조적 특성 추출"""
         if self.use_graph and self.graph_store:
@@ -303,8 +580,11 @@ class RAGPipeline:
         concept_b: Concept
     ) -> Any:
         """두 개념의 공유 구조 분석"""
-        struct_a = await self.extract_concept_structure(concept_a)
-        struct_b = await self.extract_concept_structure(concept_b)
+        # 두 구조 추출은 독립적인 DB 왕복 — 동시에 실행
+        struct_a, struct_b = await asyncio.gather(
+            self.extract_concept_structure(concept_a),
+            self.extract_concept_structure(concept_b)
+        )
 
         if self.use_graph and self.graph_store:
             try:
@@ -333,10 +613,11 @@ class RAGPipeline:
         Returns:
             생성된 문서 ID
         """
-        import hashlib
-
-        # Generate ID
-        doc_id = metadata.get('id') or hashlib.md5(content.encode()).hexdigest()[:12]
+        # Generate ID — blake2b가 md5보다 빠르고, digest_size=6이면
+        # 잘라 버리는 바이트 없이 정확히 12 hex 문자가 나온다
+        doc_id = metadata.get('id') or hashlib.blake2b(
+            content.encode('utf-8'), digest_size=6
+        ).hexdigest()
 
         # Create concept (description is a @property, not a constructor arg)
         concept = Concept(
@@ -349,9 +630,52 @@ class RAGPipeline:
         # Add to vector store
         await self.vector_store.add_concept(concept)
 
+        # 코퍼스가 바뀌었으니 캐시된 검색 결과는 더 이상 유효하지 않다
+        self.invalidate_cache()
+
         print(f"Added document: {doc_id} ({concept.name})", file=sys.stderr)
         return doc_id
 
+    async def add_documents(
+        self,
+        docs: List[tuple]
+    ) -> List[str]:
+        """
+        문서 일괄 추가 (대량 인제스트용)
+
+        Args:
+            docs: (content, metadata) 튜플 목록
+
+        Returns:
+            생성된 문서 ID 목록 (입력 순서 유지)
+        """
+        doc_ids: List[str] = []
+        concepts: List[Concept] = []
+        for content, metadata in docs:
+            doc_id = metadata.get('id') or hashlib.blake2b(
+                content.encode('utf-8'), digest_size=6
+            ).hexdigest()
+            doc_ids.append(doc_id)
+            concepts.append(Concept(
+                id=doc_id,
+                name=metadata.get('name', 'Untitled'),
+                domain=metadata.get('domain', 'general'),
+                full_text=content
+            ))
+
+        # 스토어가 배치 API를 지원하면 문서당 왕복 대신 묶어서 전송
+        add_batch = getattr(self.vector_store, "add_concepts_batch", None)
+        if add_batch is not None:
+            await add_batch(concepts)
+        else:
+            for concept in concepts:
+                await self.vector_store.add_concept(concept)
+
+        self.invalidate_cache()
+
+        print(f"Added {len(doc_ids)} documents", file=sys.stderr)
+        return doc_ids
+
     async def get_stats(self) -> Dict[str, Any]:
         """저장소 통계 조회"""
         return {
@@ -368,35 +692,79 @@ class RAGPipeline:
     def _fuse_results(
         self,
         vector_results: List[Any],
-        graph_results: List[Any]
+        graph_results: List[Any],
+        limit: Optional[int] = None
     ) -> List[Concept]:
         """
         Reciprocal Rank Fusion (RRF)으로 결과 융합
 
         RRF score = Σ 1/(k + rank) for each result list
+        limit이 주어지면 전체 정렬 대신 heapq.nlargest로 상위 k개만 뽑는다.
         """
-        k = 60  # RRF constant
-        scores = {}
-
-        # Score from vector results
-        for rank, result in enumerate(vector_results):
-            concept_id = result.id if hasattr(result, 'id') else str(result)
-            if concept_id not in scores:
-                scores[concept_id] = {"concept": result, "score": 0}
-            scores[concept_id]["score"] += 1 / (k + rank + 1)
-
-        # Score from graph results
-        for rank, result in enumerate(graph_results):
-            concept_id = result.id if hasattr(result, 'id') else str(result)
-            if concept_id not in scores:
-                scores[concept_id] = {"concept": result, "score": 0}
-            scores[concept_id]["score"] += 1 / (k + rank + 1)
-
-        # Sort by fused score
-        sorted_results = sorted(
-            scores.values(),
-            key=lambda x: x["score"],
-            reverse=True
-        )
+        scores: Dict[str, list] = {}  # concept_id -> [concept, score]
+
+        for results in (vector_results, graph_results):
+            for rank, result in enumerate(results):
+                weight = (
+                    _RRF_WEIGHTS[rank] if rank < len(_RRF_WEIGHTS)
+                    else 1.0 / (RRF_K + rank + 1)
+                )
+                # setdefault + 리스트 누적 — 엔트리당 dict 해시 조회 1회
+                scores.setdefault(_result_id(result), [result, 0.0])[1] += weight
+
+        if limit is not None and limit < len(scores):
+            # O(n log k) 상위 k 선택
+            top = heapq.nlargest(limit, scores.values(), key=lambda x: x[1])
+        else:
+            top = sorted(scores.values(), key=lambda x: x[1], reverse=True)
+
+        return [concept for concept, _ in top]
+
+    def _fuse_results_numpy(
+        self,
+        vector_results: List[Any],
+        graph_results: List[Any],
+        limit: Optional[int] = None
+    ) -> List[Concept]:
+        """
+        대규모 후보용 RRF — dict-of-dict 대신 SoA numpy 배열로 누적
 
-        return [r["concept"] for r in sorted_results]
+        per-엔트리 파이썬 객체 할당 없이 가중치 계산/집계가 C 루프로 돈다.
+        numpy를 쓸 수 없으면 순수 파이썬 구현으로 폴백.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            return self._fuse_results(vector_results, graph_results, limit)
+
+        all_results = list(vector_results) + list(graph_results)
+        if not all_results:
+            return []
+
+        # id → 연속 정수 인덱스 (첫 등장 순서 유지, np.unique의 정렬 비용 회피)
+        id_to_idx: Dict[str, int] = {}
+        indices = [
+            id_to_idx.setdefault(_result_id(r), len(id_to_idx))
+            for r in all_results
+        ]
+        ranks = np.concatenate([
+            np.arange(len(vector_results)),
+            np.arange(len(graph_results))
+        ])
+        weights = 1.0 / (RRF_K + ranks + 1)
+
+        # 누적 전체가 C 루프 한 번
+        agg = np.bincount(indices, weights=weights, minlength=len(id_to_idx))
+
+        # 각 id의 대표 객체 (첫 등장)
+        representative: Dict[int, Any] = {}
+        for result, idx in zip(all_results, indices):
+            representative.setdefault(idx, result)
+
+        if limit is not None and limit < len(agg):
+            top_idx = np.argpartition(-agg, limit)[:limit]
+            top_idx = top_idx[np.argsort(-agg[top_idx])]
+        else:
+            top_idx = np.argsort(-agg)
+
+        return [representative[int(i)] for i in top_idx]
@@ -5,8 +5,12 @@ Session Manager - 대화 세션 관리자
 학습 진행 상황 및 통찰 기록
 """
 
+import asyncio
 import json
+import os
+import threading
 import uuid
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Dict, Any
@@ -21,6 +25,74 @@ from src.models.dialogue import (
     SocraticQuestion
 )
 
+# C 가속 직렬화 (미설치 환경에서는 표준 json으로 폴백)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps_pretty(obj: Any) -> bytes:
+    """세션 딕셔너리 → 들여쓰기된 JSON 바이트"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """JSON 바이트 → 파이썬 객체"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _peek_header(path: Path) -> Optional[Dict[str, Any]]:
+    """세션 파일의 앞부분만 읽어 metadata + topic을 추출
+
+    목록에 필요한 필드는 모두 turns 배열 앞에 직렬화되므로, 처음 4KB에서
+    "turns" 키 직전까지 자르고 객체를 닫아 파싱하면 O(턴 수) 디코딩을
+    건너뛸 수 있다. 실패 시 None — 호출자가 전체 파싱으로 폴백한다.
+    """
+    try:
+        with open(path, "rb") as f:
+            buf = f.read(4096)
+        cut = buf.find(b'"turns"')
+        if cut < 0:
+            return None
+        head = buf[:cut].rstrip().rstrip(b",")
+        # dialogue 객체와 루트 객체를 닫는다
+        return _loads(head + b"}}")
+    except Exception:
+        return None
+
+
+def _dumps_compact(obj: Any) -> bytes:
+    """저널 레코드용 한 줄 JSON 바이트"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# 저널 이벤트가 이만큼 쌓이면 전체 스냅샷으로 컴팩션
+_COMPACT_THRESHOLD = 50
+
+# 디바운스 스냅샷 주기 (초) — 연속 변경을 한 번의 쓰기로 합친다
+_FLUSH_INTERVAL = 0.5
+
+# enum 역방향 값 테이블 — Enum.__call__의 멤버 스캔 대신 O(1) 딕셔너리 조회
+_MODE = {m.value: m for m in DialogueMode}
+_FOCUS = {f.value: f for f in DialogueFocus}
+_DEPTH = {d.value: d for d in DepthLevel}
+
+# 정수 깊이 → DepthLevel (set_depth와 저널 재생이 공유)
+_DEPTH_MAP = {
+    1: DepthLevel.SHALLOW,
+    2: DepthLevel.SHALLOW,
+    3: DepthLevel.MEDIUM,
+    4: DepthLevel.DEEP,
+    5: DepthLevel.DEEP
+}
+
 
 @dataclass
 class LearningProgress:
@@ -32,6 +104,8 @@ class LearningProgress:
     depth_reached: int = 1
     connections_made: List[Dict[str, str]] = field(default_factory=list)  # [{from, to, type}]
     challenges_faced: List[str] = field(default_factory=list)
+    # concepts_explored의 O(1) 멤버십 판정용 병렬 집합 (직렬화 제외)
+    _explored_set: set = field(default_factory=set, repr=False, compare=False)
 
 
 @dataclass
@@ -55,6 +129,8 @@ class Session:
 
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환"""
+        progress = asdict(self.progress)
+        progress.pop("_explored_set", None)  # 파생 캐시 — 저장하지 않는다
         return {
             "metadata": asdict(self.metadata),
             "dialogue": {
@@ -79,7 +155,7 @@ class Session:
                     for turn in self.dialogue.turns
                 ]
             },
-            "progress": asdict(self.progress)
+            "progress": progress
         }
 
     @classmethod
@@ -92,9 +168,9 @@ class Session:
         dialogue = DialogueState(
             id=dialogue_data["id"],
             topic=dialogue_data["topic"],
-            mode=DialogueMode(dialogue_data["mode"]),
-            focus=DialogueFocus(dialogue_data["focus"]),
-            depth=DepthLevel(dialogue_data["depth"]),
+            mode=_MODE[dialogue_data["mode"]],
+            focus=_FOCUS[dialogue_data["focus"]],
+            depth=_DEPTH[dialogue_data["depth"]],
             current_position=dialogue_data["current_position"],
             explored_concepts=dialogue_data["explored_concepts"],
             challenged_premises=dialogue_data["challenged_premises"],
@@ -114,8 +190,12 @@ class Session:
                 insights=turn_data["insights"]
             )
             dialogue.turns.append(turn)
+        # 로드 후 최근 턴 뷰 재구축 (이후 add_turn이 이어서 유지)
+        dialogue.recent_turns.extend(dialogue.turns[-6:])
 
         progress = LearningProgress(**data["progress"])
+        # 로드 후 멤버십 집합 재구축
+        progress._explored_set = set(progress.concepts_explored)
 
         return cls(
             metadata=metadata,
@@ -141,11 +221,27 @@ class SessionManager:
             storage_path: 세션 저장 경로 (기본: ./data/sessions)
         """
         self.storage_path = storage_path or Path("./data/sessions")
-        self.storage_path.mkdir(parents=True, exist_ok=True)
+        # stat이 mkdir 시스콜보다 싸다 — 이미 있으면 건너뛴다
+        if not self.storage_path.exists():
+            self.storage_path.mkdir(parents=True, exist_ok=True)
 
         # 메모리 내 활성 세션
         self.active_sessions: Dict[str, Session] = {}
 
+        # 세션별 미컴팩션 저널 이벤트 수
+        self._journal_counts: Dict[str, int] = {}
+
+        # 배치 중인 세션의 저널 쓰기 버퍼 (begin_batch 참고)
+        self._batch_buffers: Dict[str, List[bytes]] = {}
+
+        # 디바운스 스냅샷 — 변경된 세션 ID와 예약된 플러시 태스크
+        self._dirty: set = set()
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # 세션 목록용 요약 인덱스 (파일 전수 파싱 회피)
+        self._index_path = self.storage_path / "index.json"
+        self._index: Dict[str, Dict[str, Any]] = self._load_index()
+
     def create_session(
         self,
         topic: str,
@@ -198,6 +294,9 @@ class SessionManager:
         # 활성 세션에 추가
         self.active_sessions[session_id] = session
 
+        # 초기 스냅샷 — 이후 변경은 저널에 추가되고 재생 시 이 위에 얹힌다
+        self.save_session(session)
+
         return session
 
     def get_session(self, session_id: str) -> Optional[Session]:
@@ -209,30 +308,260 @@ class SessionManager:
         # 파일에서 로드
         return self._load_from_file(session_id)
 
-    def save_session(self, session: Session) -> bool:
-        """세션 저장"""
+    def save_session(self, session: Session, durable: bool = False) -> bool:
+        """세션 저장 (전체 스냅샷 — 저널 컴팩션 역할도 겸한다)
+
+        임시 파일에 쓴 뒤 os.replace로 원자 교체 — 중간에 죽어도
+        기존 파일은 온전하다. fsync는 비용이 커서 durable=True
+        (세션 완료/종료)일 때만 수행한다.
+        """
         session.metadata.updated_at = datetime.now().isoformat()
 
         # 파일에 저장
-        file_path = self.storage_path / f"{session.metadata.session_id}.json"
+        session_id = session.metadata.session_id
+        file_path = self.storage_path / f"{session_id}.json"
+        tmp_path = file_path.with_suffix(".json.tmp")
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(session.to_dict(), f, ensure_ascii=False, indent=2)
+            with open(tmp_path, "wb") as f:
+                f.write(_dumps_pretty(session.to_dict()))
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
+
+            # 스냅샷에 모든 이벤트가 반영됐으니 저널은 비운다
+            journal = self._journal_path(session_id)
+            if journal.exists():
+                journal.unlink()
+            self._journal_counts.pop(session_id, None)
+            self._dirty.discard(session_id)
+            self._update_index(session)
             return True
         except Exception as e:
             print(f"Error saving session: {e}")
             return False
 
+    def _journal_path(self, session_id: str) -> Path:
+        """세션 이벤트 저널 경로"""
+        return self.storage_path / f"{session_id}.turns.jsonl"
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """요약 인덱스 로드 (없거나 손상 시 빈 인덱스)"""
+        try:
+            with open(self._index_path, "rb") as f:
+                return _loads(f.read())
+        except Exception:
+            return {}
+
+    def _write_index(self):
+        """인덱스를 임시 파일 + os.replace로 원자적 재작성"""
+        tmp = self._index_path.with_suffix(".json.tmp")
+        try:
+            with open(tmp, "wb") as f:
+                f.write(_dumps_compact(self._index))
+            os.replace(tmp, self._index_path)
+        except Exception as e:
+            print(f"Error writing session index: {e}")
+
+    def _update_index(self, session: Session):
+        """세션 요약 필드를 인덱스에 반영"""
+        meta = session.metadata
+        self._index[meta.session_id] = {
+            "session_id": meta.session_id,
+            "user_id": meta.user_id,
+            "topic": session.dialogue.topic,
+            "status": meta.status,
+            "created_at": meta.created_at,
+            "updated_at": meta.updated_at,
+            "total_turns": meta.total_turns
+        }
+        self._write_index()
+
+    def _append_event(self, session: Session, op: str, payload: Dict[str, Any]):
+        """변경 이벤트를 저널에 추가 (전체 재직렬화 없이 O(1) 쓰기)
+
+        이벤트가 _COMPACT_THRESHOLD를 넘으면 스냅샷으로 컴팩션한다.
+        """
+        session_id = session.metadata.session_id
+        now = datetime.now().isoformat()
+        session.metadata.updated_at = now
+
+        record = {"op": op, "ts": now}
+        record.update(payload)
+
+        # 배치 중이면 버퍼에만 쌓고 파일 쓰기는 commit 시점에 한 번
+        buffer = self._batch_buffers.get(session_id)
+        if buffer is not None:
+            buffer.append(_dumps_compact(record))
+            return
+
+        try:
+            with open(self._journal_path(session_id), "ab") as f:
+                f.write(_dumps_compact(record) + b"\n")
+        except Exception as e:
+            # 저널 실패 시 전체 저장으로 폴백 (데이터 유실 방지 우선)
+            print(f"Error appending session event: {e}")
+            self.save_session(session)
+            return
+
+        count = self._journal_counts.get(session_id, 0) + 1
+        self._journal_counts[session_id] = count
+        if count >= _COMPACT_THRESHOLD:
+            self.compact(session_id)
+        else:
+            self._mark_dirty(session_id)
+
+    @contextmanager
+    def begin_batch(self, session_id: str):
+        """여러 변경 이벤트를 모아 저널에 한 번만 쓰는 컨텍스트
+
+        한 턴에서 add_turn/add_insights/update_position처럼 연달아
+        불리는 뮤테이터의 파일 열기·쓰기를 1회로 줄인다. 중첩 시
+        바깥 배치가 플러시를 담당한다.
+        """
+        if session_id in self._batch_buffers:
+            yield
+            return
+
+        self._batch_buffers[session_id] = []
+        try:
+            yield
+        finally:
+            records = self._batch_buffers.pop(session_id, [])
+            if records:
+                self._flush_batch(session_id, records)
+
+    def _flush_batch(self, session_id: str, records: List[bytes]):
+        """배치 버퍼를 저널에 단일 쓰기로 반영"""
+        try:
+            with open(self._journal_path(session_id), "ab") as f:
+                f.write(b"".join(r + b"\n" for r in records))
+        except Exception as e:
+            print(f"Error appending session batch: {e}")
+            session = self.active_sessions.get(session_id)
+            if session:
+                self.save_session(session)
+            return
+
+        count = self._journal_counts.get(session_id, 0) + len(records)
+        self._journal_counts[session_id] = count
+        if count >= _COMPACT_THRESHOLD:
+            self.compact(session_id)
+        else:
+            self._mark_dirty(session_id)
+
+    def _mark_dirty(self, session_id: str):
+        """디바운스 스냅샷 예약 (이벤트 루프 밖이면 저널만으로 충분)"""
+        self._dirty.add(session_id)
+        if self._flush_task is None or self._flush_task.done():
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return
+            self._flush_task = loop.create_task(self._flush_loop())
+
+    async def _flush_loop(self):
+        """짧게 기다렸다가 변경된 세션을 한꺼번에 스냅샷"""
+        await asyncio.sleep(_FLUSH_INTERVAL)
+        self.flush()
+
+    def flush(self, durable: bool = False):
+        """변경된 세션을 즉시 스냅샷 (완료/종료 시 동기 호출용)"""
+        for session_id in list(self._dirty):
+            session = self.active_sessions.get(session_id)
+            if session:
+                self.save_session(session, durable=durable)
+        self._dirty.clear()
+
+    def compact(self, session_id: str):
+        """저널을 전체 스냅샷으로 컴팩션"""
+        session = self.active_sessions.get(session_id)
+        if session:
+            self.save_session(session)
+
+    @staticmethod
+    def _apply_event(session: Session, record: Dict[str, Any]):
+        """저널 이벤트를 세션에 재생 (뮤테이터의 인메모리 로직과 동일)"""
+        op = record.get("op")
+
+        if op == "turn":
+            turn = DialogueTurn(
+                timestamp=datetime.fromisoformat(record["timestamp"]),
+                speaker=record["speaker"],
+                content=record["content"],
+                questions=[SocraticQuestion(**q) for q in record["questions"]],
+                related_concepts=record["related_concepts"],
+                insights=record["insights"]
+            )
+            session.dialogue.add_turn(turn)
+            session.metadata.total_turns += 1
+            explored = session.progress._explored_set
+            for concept in turn.related_concepts:
+                if concept not in explored:
+                    explored.add(concept)
+                    session.progress.concepts_explored.append(concept)
+            if turn.insights:
+                session.progress.insights_gained.extend(turn.insights)
+            if turn.speaker == "polymath" and turn.questions:
+                session.progress.questions_asked += len(turn.questions)
+            elif turn.speaker == "user":
+                session.progress.questions_answered += 1
+
+        elif op == "position":
+            session.dialogue.current_position = record["position"]
+
+        elif op == "insight":
+            session.dialogue.synthesized_insights.append(record["insight"])
+            session.progress.insights_gained.append(record["insight"])
+
+        elif op == "insights":
+            session.dialogue.synthesized_insights.extend(record["insights"])
+            session.progress.insights_gained.extend(record["insights"])
+
+        elif op == "connection":
+            session.progress.connections_made.append({
+                "from": record["from"],
+                "to": record["to"],
+                "type": record["type"]
+            })
+
+        elif op == "premise":
+            session.dialogue.challenged_premises.append(record["premise"])
+            session.progress.challenges_faced.append(record["premise"])
+
+        elif op == "depth":
+            depth = record["depth"]
+            session.dialogue.depth = _DEPTH_MAP.get(depth, DepthLevel.MEDIUM)
+            session.progress.depth_reached = max(
+                session.progress.depth_reached, depth
+            )
+
+        if "ts" in record:
+            session.metadata.updated_at = record["ts"]
+
     def _load_from_file(self, session_id: str) -> Optional[Session]:
-        """파일에서 세션 로드"""
+        """파일에서 세션 로드 (스냅샷 + 저널 재생)"""
         file_path = self.storage_path / f"{session_id}.json"
         if not file_path.exists():
             return None
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(file_path, "rb") as f:
+                data = _loads(f.read())
             session = Session.from_dict(data)
+
+            # 스냅샷 이후의 이벤트를 순서대로 재생
+            journal = self._journal_path(session_id)
+            if journal.exists():
+                count = 0
+                with open(journal, "rb") as f:
+                    for line in f:
+                        line = line.strip()
+                        if line:
+                            self._apply_event(session, _loads(line))
+                            count += 1
+                self._journal_counts[session_id] = count
+
             # 활성 세션에 추가
             self.active_sessions[session_id] = session
             return session
@@ -276,10 +605,12 @@ class SessionManager:
         session.dialogue.add_turn(turn)
         session.metadata.total_turns += 1
 
-        # 진행 상황 업데이트
+        # 진행 상황 업데이트 (멤버십은 집합으로 O(1) 판정)
         if related_concepts:
+            explored = session.progress._explored_set
             for concept in related_concepts:
-                if concept not in session.progress.concepts_explored:
+                if concept not in explored:
+                    explored.add(concept)
                     session.progress.concepts_explored.append(concept)
 
         if insights:
@@ -290,8 +621,15 @@ class SessionManager:
         elif speaker == "user":
             session.progress.questions_answered += 1
 
-        # 자동 저장
-        self.save_session(session)
+        # 전체 재저장 대신 턴 이벤트만 저널에 추가
+        self._append_event(session, "turn", {
+            "timestamp": turn.timestamp.isoformat(),
+            "speaker": turn.speaker,
+            "content": turn.content,
+            "questions": [asdict(q) for q in turn.questions],
+            "related_concepts": turn.related_concepts,
+            "insights": turn.insights
+        })
 
         return turn
 
@@ -306,9 +644,8 @@ class SessionManager:
             return False
 
         session.dialogue.current_position = new_position
-        session.metadata.updated_at = datetime.now().isoformat()
 
-        self.save_session(session)
+        self._append_event(session, "position", {"position": new_position})
         return True
 
     def add_insight(
@@ -324,7 +661,26 @@ class SessionManager:
         session.dialogue.synthesized_insights.append(insight)
         session.progress.insights_gained.append(insight)
 
-        self.save_session(session)
+        self._append_event(session, "insight", {"insight": insight})
+        return True
+
+    def add_insights(
+        self,
+        session_id: str,
+        insights: List[str]
+    ) -> bool:
+        """통찰 일괄 추가 — 건당 조회/저널 쓰기 대신 한 번에 처리"""
+        if not insights:
+            return True
+
+        session = self.get_session(session_id)
+        if not session:
+            return False
+
+        session.dialogue.synthesized_insights.extend(insights)
+        session.progress.insights_gained.extend(insights)
+
+        self._append_event(session, "insights", {"insights": list(insights)})
         return True
 
     def add_connection(
@@ -346,7 +702,7 @@ class SessionManager:
         }
         session.progress.connections_made.append(connection)
 
-        self.save_session(session)
+        self._append_event(session, "connection", connection)
         return True
 
     def challenge_premise(
@@ -362,7 +718,7 @@ class SessionManager:
         session.dialogue.challenged_premises.append(premise)
         session.progress.challenges_faced.append(premise)
 
-        self.save_session(session)
+        self._append_event(session, "premise", {"premise": premise})
         return True
 
     def set_depth(
@@ -375,18 +731,10 @@ class SessionManager:
         if not session:
             return False
 
-        depth_map = {
-            1: DepthLevel.SHALLOW,
-            2: DepthLevel.SHALLOW,
-            3: DepthLevel.MEDIUM,
-            4: DepthLevel.DEEP,
-            5: DepthLevel.DEEP
-        }
-
-        session.dialogue.depth = depth_map.get(depth, DepthLevel.MEDIUM)
+        session.dialogue.depth = _DEPTH_MAP.get(depth, DepthLevel.MEDIUM)
         session.progress.depth_reached = max(session.progress.depth_reached, depth)
 
-        self.save_session(session)
+        self._append_event(session, "depth", {"depth": depth})
         return True
 
     def get_session_summary(self, session_id: str) -> Optional[Dict[str, Any]]:
@@ -408,37 +756,97 @@ class SessionManager:
             "current_position": session.dialogue.current_position[:100] if session.dialogue.current_position else ""
         }
 
+    def aggregate_user_stats(self, user_id: str = "default") -> Dict[str, Any]:
+        """사용자 전체 세션의 학습 통계를 한 번에 집계
+
+        호출자가 세션별로 get_session을 반복하는 N+1 패턴 대신,
+        매니저 내부에서 한 번의 순회로 개념/통찰/연결을 모은다.
+        """
+        if not self._index:
+            self._rebuild_index_from_files()
+
+        session_ids = [
+            session_id
+            for session_id, entry in self._index.items()
+            if entry.get("user_id") == user_id
+        ]
+        sessions = [
+            session
+            for session in (self.get_session(sid) for sid in session_ids)
+            if session
+        ]
+
+        # 열 단위 축약 — 세션별 update 루프 대신 union/sum 각 1회
+        concepts = (
+            set().union(*(s.progress._explored_set for s in sessions))
+            if sessions else set()
+        )
+        insights = sum(len(s.progress.insights_gained) for s in sessions)
+        connections = sum(len(s.progress.connections_made) for s in sessions)
+
+        return {
+            "concepts_explored": concepts,
+            "insights_gained": insights,
+            "connections_made": connections
+        }
+
     def list_sessions(
         self,
         user_id: str = "default",
         status: Optional[str] = None
     ) -> List[Dict[str, Any]]:
-        """사용자의 세션 목록 반환"""
-        sessions = []
+        """사용자의 세션 목록 반환 (인덱스 우선, 없으면 파일 전수 스캔)"""
+        if not self._index:
+            self._rebuild_index_from_files()
+
+        sessions = [
+            {
+                "session_id": entry.get("session_id"),
+                "topic": entry.get("topic"),
+                "status": entry.get("status"),
+                "created_at": entry.get("created_at"),
+                "updated_at": entry.get("updated_at"),
+                "total_turns": entry.get("total_turns", 0)
+            }
+            for entry in self._index.values()
+            if entry.get("user_id") == user_id
+            and (status is None or entry.get("status") == status)
+        ]
+
+        # 최신 순 정렬
+        sessions.sort(key=lambda s: s.get("updated_at", ""), reverse=True)
+        return sessions
 
-        # 파일에서 모든 세션 로드
+    def _rebuild_index_from_files(self):
+        """저장된 세션 파일에서 인덱스 재구축 (인덱스 유실 시 1회 비용)"""
         for file_path in self.storage_path.glob("*.json"):
+            if file_path == self._index_path:
+                continue
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                # 헤더만 읽어도 요약 필드는 전부 나온다 — 턴 파싱 생략
+                data = _peek_header(file_path)
+                if data is None:
+                    with open(file_path, "rb") as f:
+                        data = _loads(f.read())
 
                 meta = data.get("metadata", {})
-                if meta.get("user_id") == user_id:
-                    if status is None or meta.get("status") == status:
-                        sessions.append({
-                            "session_id": meta.get("session_id"),
-                            "topic": data.get("dialogue", {}).get("topic"),
-                            "status": meta.get("status"),
-                            "created_at": meta.get("created_at"),
-                            "updated_at": meta.get("updated_at"),
-                            "total_turns": meta.get("total_turns", 0)
-                        })
+                session_id = meta.get("session_id")
+                if not session_id:
+                    continue
+                self._index[session_id] = {
+                    "session_id": session_id,
+                    "user_id": meta.get("user_id"),
+                    "topic": data.get("dialogue", {}).get("topic"),
+                    "status": meta.get("status"),
+                    "created_at": meta.get("created_at"),
+                    "updated_at": meta.get("updated_at"),
+                    "total_turns": meta.get("total_turns", 0)
+                }
             except Exception:
                 continue
 
-        # 최신 순 정렬
-        sessions.sort(key=lambda s: s.get("updated_at", ""), reverse=True)
-        return sessions
+        if self._index:
+            self._write_index()
 
     def complete_session(self, session_id: str) -> bool:
         """세션 완료 처리"""
@@ -449,7 +857,9 @@ class SessionManager:
         session.metadata.status = "completed"
         session.metadata.updated_at = datetime.now().isoformat()
 
-        self.save_session(session)
+        # 대기 중인 다른 세션 변경분도 함께 내려쓰고, 완료본은 fsync까지
+        self.flush()
+        self.save_session(session, durable=True)
 
         # 활성 세션에서 제거
         if session_id in self.active_sessions:
@@ -463,7 +873,17 @@ class SessionManager:
         if session_id in self.active_sessions:
             del self.active_sessions[session_id]
 
-        # 파일 삭제
+        # 파일 삭제 (저널 포함)
+        journal = self._journal_path(session_id)
+        if journal.exists():
+            journal.unlink()
+        self._journal_counts.pop(session_id, None)
+
+        # 인덱스에서 제거
+        if session_id in self._index:
+            self._index.pop(session_id)
+            self._write_index()
+
         file_path = self.storage_path / f"{session_id}.json"
         if file_path.exists():
             file_path.unlink()
@@ -482,7 +902,7 @@ class SessionManager:
             return None
 
         if format == "json":
-            return json.dumps(session.to_dict(), ensure_ascii=False, indent=2)
+            return _dumps_pretty(session.to_dict()).decode("utf-8")
 
         elif format == "markdown":
             return self._export_as_markdown(session)
@@ -490,8 +910,23 @@ class SessionManager:
         return None
 
     def _export_as_markdown(self, session: Session) -> str:
-        """마크다운 형식으로 내보내기"""
-        md = f"""# 소크라테스적 탐구: {session.dialogue.topic}
+        """마크다운 형식으로 내보내기
+
+        문자열 +=는 매번 전체를 재할당(O(N²))하므로
+        조각 리스트를 모아 마지막에 한 번만 join한다.
+        """
+        concepts = "\n".join(
+            f"- {c}" for c in session.progress.concepts_explored
+        ) or "- (없음)"
+        insights = "\n".join(
+            f"- {i}" for i in session.progress.insights_gained
+        ) or "- (없음)"
+        connections = "\n".join(
+            f"- {c['from']} → {c['to']} ({c['type']})"
+            for c in session.progress.connections_made
+        ) or "- (없음)"
+
+        parts = [f"""# 소크라테스적 탐구: {session.dialogue.topic}
 
 ## 세션 정보
 - **세션 ID**: {session.metadata.session_id}
@@ -502,52 +937,53 @@ class SessionManager:
 ## 학습 진행
 
 ### 탐구한 개념들
-{chr(10).join([f"- {c}" for c in session.progress.concepts_explored]) or "- (없음)"}
+{concepts}
 
 ### 도출된 통찰
-{chr(10).join([f"- {i}" for i in session.progress.insights_gained]) or "- (없음)"}
+{insights}
 
 ### 발견된 연결
-{chr(10).join([f"- {c['from']} → {c['to']} ({c['type']})" for c in session.progress.connections_made]) or "- (없음)"}
+{connections}
 
 ## 대화 기록
 
-"""
+"""]
         for i, turn in enumerate(session.dialogue.turns, 1):
             speaker = "🧑 사용자" if turn.speaker == "user" else "🦉 폴리매스"
-            md += f"""### 턴 {i} ({speaker})
+            parts.append(f"""### 턴 {i} ({speaker})
 {turn.content}
 
-"""
+""")
             if turn.questions:
-                md += "**질문들:**\n"
-                for q in turn.questions:
-                    md += f"- {q.question}\n"
-                md += "\n"
+                parts.append("**질문들:**\n")
+                parts.extend(f"- {q.question}\n" for q in turn.questions)
+                parts.append("\n")
 
             if turn.insights:
-                md += "**통찰:**\n"
-                for ins in turn.insights:
-                    md += f"- {ins}\n"
-                md += "\n"
+                parts.append("**통찰:**\n")
+                parts.extend(f"- {ins}\n" for ins in turn.insights)
+                parts.append("\n")
 
-        md += f"""
+        parts.append(f"""
 ## 현재 위치
 {session.dialogue.current_position or "(아직 정의되지 않음)"}
 
 ---
 *Polymath MCP Socratic Dialogue Export*
-"""
-        return md
+""")
+        return "".join(parts)
 
 
 # 전역 세션 관리자 인스턴스
 _session_manager: Optional[SessionManager] = None
+_sm_lock = threading.Lock()
 
 
 def get_session_manager(storage_path: Optional[Path] = None) -> SessionManager:
-    """세션 관리자 싱글톤"""
+    """세션 관리자 싱글톤 (이중 확인 잠금으로 중복 생성 방지)"""
     global _session_manager
     if _session_manager is None:
-        _session_manager = SessionManager(storage_path)
+        with _sm_lock:
+            if _session_manager is None:
+                _session_manager = SessionManager(storage_path)
     return _session_manager
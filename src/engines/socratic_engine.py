@@ -4,9 +4,173 @@ Socratic Engine - 소크라테스적 대화 엔진
 소크라테스적 질문 생성, 전제 도전, 변증법적 종합
 """
 
-from typing import List, Optional
+from typing import AsyncIterator, List, NamedTuple, Optional, Sequence
+from collections import OrderedDict, deque
+from contextlib import closing
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from itertools import islice
+import asyncio
+import hashlib
+import json
+import os
+import pickle
+import re
+import sqlite3
+import time
+
+# 동시 LLM 호출 상한 — 공급자 RPM 한도 보호 (환경 변수로 조절 가능)
+try:
+    _MAX_CONCURRENT_LLM = int(os.getenv("POLYMATH_MAX_CONCURRENT_LLM", "8"))
+except ValueError:
+    _MAX_CONCURRENT_LLM = 8
+
+# 일시적 오류(429, 타임아웃 등) 재시도 — 지수 백오프 1s → 2s → 4s
+_LLM_RETRY_ATTEMPTS = 3
+_LLM_RETRY_BASE = 1.0  # 초
+_LLM_RETRY_MAX = 8.0
+
+# 보조 호출 결과 캐시 (같은 topic/statement가 세션을 넘어 반복된다)
+_RESPONSE_CACHE_SIZE = 256
+_RESPONSE_CACHE_TTL = 600.0  # 초
+
+# 관련 개념 검색의 디스크 캐시 — 프로세스 재시작을 넘어 살아남는다
+_RAG_CACHE_FILE = "rag_cache.db"
+_RAG_CACHE_TTL = 3600.0  # 초
+
+_WS_RE = re.compile(r"\s+")
+
+# 롤링 대화 히스토리 상한 — 장수 서버 프로세스에서 메모리 고정
+_HISTORY_MAXLEN = 64
+
+# 입장 텍스트 표시 길이 상한
+_TRUNC = 50
+
+
+def _trunc(s: str, n: int = _TRUNC) -> str:
+    """len을 한 번만 재고, 필요할 때만 슬라이스 (말줄임은 U+2026 한 글자)"""
+    return s if len(s) <= n else f"{s[:n]}…"
+
+# 후속 탐구 방향은 호출마다 동일 — 모듈 튜플로 올려 두면 질문 생성 시
+# 리스트 재할당 없이 같은 객체를 공유한다
+_FOLLOWUP_CLARIFICATION = (
+    "정의의 경계 사례 탐구", "다른 정의와 비교", "정의의 역사적 변천"
+)
+_FOLLOWUP_META_EXPLORE = (
+    "개인적/학문적 동기 탐구", "더 근본적인 질문으로 이동", "실천적 함의 고려"
+)
+_FOLLOWUP_VIEWPOINT_TAIL = ("분야 간 차이점과 공통점", "융합적 관점의 가능성")
+_FOLLOWUP_BRIDGE = ("공통된 구조 찾기", "상호 보완 가능성", "새로운 융합 개념 도출")
+_FOLLOWUP_ASSUMPTION = (
+    "전제의 타당성 검토", "전제가 거짓일 경우의 결과", "대안적 전제 탐색"
+)
+_FOLLOWUP_EVIDENCE = ("반대 증거 탐색", "증거의 한계 인식", "추가 증거 필요성")
+_FOLLOWUP_IMPLICATION = ("극단적 사례 검토", "실제 적용 시 문제점", "수정이 필요한 부분")
+_FOLLOWUP_COMMON_PATTERN = ("공통점의 의미", "차이점의 의미", "통합 가능성")
+_FOLLOWUP_DIALECTIC = ("각 관점의 부분적 진리", "통합의 조건", "새로운 프레임 창조")
+_FOLLOWUP_META_SYNTHESIS = ("인식의 변화 지점", "남은 불확실성", "다음 탐구 방향")
+
+# 숨은 전제의 표지 표현 — 임포트 시 단일 교대 패턴으로 컴파일해 두고
+# 진술을 한 번만 훑는다 (표지별로 별도 검색하지 않음)
+_PREMISE_MARKER_RE = re.compile(
+    r"(?P<universal>모든|모두|누구나|항상|언제나)"
+    r"|(?P<necessity>반드시|필연적|해야만)"
+    r"|(?P<obvious>당연히|분명히|자명하)"
+    r"|(?P<causal>때문에|으로\s*인해)"
+)
+
+# 표지 그룹 → (전제 유형, 잠재적 문제, 도전 질문 템플릿)
+_PREMISE_MARKER_INFO = {
+    "universal": (
+        "전칭 가정",
+        "'{marker}'이(가) 예외 없이 성립한다고 전제하고 있음",
+        "'{marker}'에 해당하지 않는 반례는 정말 없을까요?"
+    ),
+    "necessity": (
+        "필연성 가정",
+        "'{marker}'라는 표현이 다른 가능성을 배제하고 있음",
+        "그것이 필연적이지 않다면 어떤 대안이 열릴까요?"
+    ),
+    "obvious": (
+        "자명성 가정",
+        "'{marker}' 뒤에 검토되지 않은 믿음이 숨어 있을 수 있음",
+        "왜 그것이 자명하다고 생각하게 되었나요?"
+    ),
+    "causal": (
+        "인과 가정",
+        "'{marker}' 연결이 상관관계를 인과로 단정하고 있을 수 있음",
+        "그 원인이 아니어도 같은 결과가 나올 수 있지 않을까요?"
+    ),
+}
+
+# 질문 본문 템플릿 — 모듈 로드 시 한 번만 구성. 동적 값은 .format으로
+# 주입한다. 한국어 문구가 한곳에 모여 있어 수정/국제화도 쉬워진다.
+_TEMPLATES = {
+    "clarification": "'{topic}'에서 가장 핵심적인 개념은 무엇인가요? 그 개념을 어떻게 정의하시겠어요?",
+    "meta_explore": "이 주제를 탐구하는 것이 왜 중요한가요? 우리가 진정으로 알고 싶은 것은 무엇인가요?",
+    "viewpoint": "{domain} 분야에서는 이 문제를 어떻게 바라볼까요?",
+    "bridge": "'{name_a}'과 '{name_b}'이 '{topic}'에서 만난다면 어떤 대화를 나눌까요?",
+    "assumption": "'{position}...'라고 하셨는데, 이 주장이 전제하는 것은 무엇인가요?",
+    "evidence": "이 입장을 지지하는 가장 강력한 증거는 무엇인가요? 그 증거는 얼마나 확실한가요?",
+    "implication": "이 생각을 끝까지 밀고 가면 어떤 결론에 도달하나요? 그 결론을 받아들일 수 있나요?",
+    "common_pattern": "지금까지 탐구한 다양한 관점들에서 공통적으로 발견되는 것은 무엇인가요?",
+    "dialectic": "서로 대립하는 것처럼 보이는 관점들을 모두 포괄하는 더 높은 관점이 있을까요?",
+    "meta_synthesis": "이 탐구를 통해 발견한 것이 당신의 기존 생각을 어떻게 변화시켰나요?",
+}
+
+# 호출마다 바이트 단위로 동일한 한국어 본문 — 모듈 상수로 분리해 두면
+# LLM 클라이언트 연결 시 안정 접두(prefix)로 그대로 전송해 공급자 측
+# 프롬프트 캐시(KV 재사용)를 타고, 동적 값은 접미(suffix)에만 남는다.
+_SYNTHESIS_BODY = """
+각 입장이 포착하는 부분적 진리를 인정하면서,
+이들을 포괄하는 더 통합적인 관점을 구성할 수 있습니다.
+
+핵심은 대립을 '이것 아니면 저것'으로 보지 않고,
+'이것과 저것의 관계'로 재구성하는 것입니다.
+"""
+
+_TENSIONS_BODY = (
+    "완전한 종합에 이르지 못한 긴장 지점들이 남아있으며, "
+    "이는 더 깊은 탐구의 출발점이 됩니다."
+)
+
+_DIRECTION_TEMPLATE = """
+다음 탐구 방향을 제안합니다:
+
+1. **개념 명료화**: '{topic}'의 핵심 개념을 더 정확히 정의하기
+2. **분야 간 대화**: {domains} 관점에서 바라보기
+3. **전제 검토**: 당연시되는 가정들을 드러내고 검토하기
+4. **함의 추적**: 이 생각이 이끄는 결론을 끝까지 따라가기
+
+"검증되지 않은 삶은 살 가치가 없다" - 소크라테스
+"""
+
+_DIRECTION_FALLBACK = "개념을 명료화하고 숨겨진 전제를 드러내는 것부터 시작하세요."
+
+# 검색 결과가 비었을 때의 응답은 입력만의 순수 함수 — 재조립을 건너뛰고
+# 통째로 재사용한다. (topic, user_position, depth, focus) → DialogueResponse
+_EMPTY_RESPONSE_CACHE: "OrderedDict[tuple, DialogueResponse]" = OrderedDict()
+_EMPTY_RESPONSE_CACHE_SIZE = 128
+
+# synthesize()의 네 보조 출력(통찰/종합/긴장/심화 질문)을 한 번의
+# 왕복으로 받아내는 통합 프롬프트. JSON 스키마를 본문에 고정해 두면
+# 이 블록 전체가 호출 간 안정 접두가 된다.
+_ONE_SHOT_SYNTHESIS_PROMPT = """당신은 변증법적 종합을 돕는 소크라테스적 대화 파트너입니다.
+주어진 주제와 입장들에 대해 아래 네 가지를 모두 생성하고,
+반드시 다음 JSON 형식으로만 응답하세요:
+
+{
+  "insights": [{"position": "...", "core_insight": "..."}],
+  "synthesis": "...",
+  "tensions": "...",
+  "deeper_questions": ["...", "...", "..."]
+}
+
+- insights: 각 입장이 포착하는 핵심 통찰 (입장 순서 유지)
+- synthesis: 대립을 포괄하는 통합적 관점 시도
+- tensions: 종합에 이르지 못한 남은 긴장 지점
+- deeper_questions: 탐구를 이어갈 더 깊은 질문 3개"""
 
 
 class DialogueMode(Enum):
@@ -25,15 +189,15 @@ class QuestionType(Enum):
     BRIDGE = "bridge"
 
 
-@dataclass
-class SocraticQuestion:
+class SocraticQuestion(NamedTuple):
+    """핫 패스 결과 타입 — 생성만 하고 버려지므로 NamedTuple이 가장 싸다"""
     question: str
     question_type: str
     purpose: str
-    follow_up_directions: List[str]
+    follow_up_directions: Sequence[str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DialogueResponse:
     questions: List[SocraticQuestion]
     related_concepts: List[str]
@@ -41,7 +205,7 @@ class DialogueResponse:
     depth_level: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HiddenPremise:
     premise: str
     premise_type: str
@@ -49,20 +213,20 @@ class HiddenPremise:
     challenge_question: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PremiseChallenge:
     hidden_premises: List[HiddenPremise]
     counter_perspective: Optional[str]
     alternative_views: List
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PositionInsight:
     position: str
     core_insight: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Synthesis:
     position_insights: List[PositionInsight]
     synthesis_attempt: str
@@ -81,11 +245,76 @@ class SocraticEngine:
     - 논리적 결과를 추적하게 함
     """
 
-    def __init__(self, rag_pipeline, fusion_engine):
+    def __init__(self, rag_pipeline, fusion_engine, llm_client=None):
         self.rag = rag_pipeline
         self.fusion = fusion_engine
+        # 선택적 LLM 클라이언트 — 있으면 synthesize()를 단일 호출로 배칭
+        self.llm = llm_client
         self.mode = DialogueMode.HYBRID
-        self.dialogue_history = []
+        # 오래된 턴은 자동 탈락 — append/롤링 윈도우가 O(1)
+        self.dialogue_history = deque(maxlen=_HISTORY_MAXLEN)
+        # gather로 팬아웃되는 LLM 보조 호출의 동시성 제한
+        self._llm_sem = asyncio.Semaphore(_MAX_CONCURRENT_LLM)
+        # (namespace, 정규화 입력) → (결과, 만료 시각) TTL LRU
+        self._response_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        # 검색 결과 디스크 캐시 경로 — settings가 없으면 비활성
+        base_path = getattr(
+            getattr(rag_pipeline, "settings", None), "base_path", None
+        )
+        self._rag_cache_path = (
+            str(base_path / "data" / _RAG_CACHE_FILE) if base_path else None
+        )
+        # 코퍼스가 바뀌면 파이프라인 캐시와 함께 디스크 캐시도 비운다
+        register = getattr(rag_pipeline, "register_invalidation_hook", None)
+        if register is not None and self._rag_cache_path is not None:
+            register(self.invalidate_rag_cache)
+        # focus → 질문 스트림 매핑. 문자열 비교 체인 대신 O(1) 조회이며,
+        # 새 focus는 이 테이블에 항목을 추가하는 것만으로 등록된다.
+        self._focus_dispatch = {
+            "explore": self._stream_exploration_questions,
+            "challenge": self._stream_challenge_questions,
+            "synthesize": self._stream_synthesis_questions,
+        }
+
+    async def _limited(self, fn, *args):
+        """세마포어 슬롯 + 지수 백오프 재시도 안에서 보조 호출 실행
+
+        429/타임아웃 한 번이 gather 전체를 무너뜨리지 않도록 최대
+        3회 재시도한다. 백오프 대기 중에는 슬롯을 점유하지 않는다.
+        """
+        last_error = None
+        for attempt in range(_LLM_RETRY_ATTEMPTS):
+            try:
+                async with self._llm_sem:
+                    return await fn(*args)
+            except Exception as e:
+                last_error = e
+                if attempt < _LLM_RETRY_ATTEMPTS - 1:
+                    await asyncio.sleep(
+                        min(_LLM_RETRY_BASE * 2 ** attempt, _LLM_RETRY_MAX)
+                    )
+        raise last_error
+
+    async def _cached_helper(self, namespace: str, text: str, factory):
+        """보조 호출 결과 캐시
+
+        공백/대소문자만 다른 입력을 같은 키로 접어, 히트 시 1-3초짜리
+        LLM 왕복을 캐시 조회로 대체한다. factory는 인자 없는 코루틴 팩토리.
+        """
+        key = (namespace, _WS_RE.sub(" ", text.strip().lower()))
+        cached = self._response_cache.get(key)
+        if cached is not None and time.monotonic() < cached[1]:
+            self._response_cache.move_to_end(key)
+            return cached[0]
+
+        result = await factory()
+
+        self._response_cache[key] = (
+            result, time.monotonic() + _RESPONSE_CACHE_TTL
+        )
+        if len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+        return result
 
     def set_mode(self, mode: str):
         """대화 모드 설정"""
@@ -107,33 +336,106 @@ class SocraticEngine:
             depth: shallow/medium/deep
             focus: explore/challenge/synthesize
         """
-        # Get related concepts for context
-        related_concepts = await self._get_related_concepts(topic)
-
-        # Generate questions based on focus
-        if focus == "explore":
-            questions = await self._generate_exploration_questions(
-                topic, user_position, depth, related_concepts
-            )
-        elif focus == "challenge":
-            questions = await self._generate_challenge_questions(
-                topic, user_position, depth, related_concepts
-            )
-        else:  # synthesize
-            questions = await self._generate_synthesis_questions(
-                topic, user_position, depth, related_concepts
+        # 이 입력이 이전에 무근거(검색 결과 0건)로 끝났다면, 여전히
+        # 무근거인지 확인만 하고(검색 캐시 히트가 보통) 통째로 재사용
+        cache_key = (topic, user_position, depth, focus)
+        cached = _EMPTY_RESPONSE_CACHE.get(cache_key)
+        if cached is not None:
+            if not await self._get_related_concepts(topic):
+                _EMPTY_RESPONSE_CACHE.move_to_end(cache_key)
+                return cached
+            del _EMPTY_RESPONSE_CACHE[cache_key]
+
+        # RAG 검색을 먼저 띄워 두고, 개념에 의존하지 않는 질문 조립과 겹친다
+        rag_task = asyncio.create_task(self._get_related_concepts(topic))
+
+        # 스트리밍 경로를 수집하는 얇은 셸 — 질문 생성 로직은 한 곳에만 둔다
+        questions = [
+            q async for q in self._question_stream(
+                topic, user_position, depth, focus, rag_task
             )
+        ]
+        related_concepts = await rag_task
 
         # Determine suggested direction
         direction = self._suggest_direction(topic, questions, related_concepts)
 
-        return DialogueResponse(
+        response = DialogueResponse(
             questions=questions,
             related_concepts=[c.name for c in related_concepts],
             suggested_direction=direction,
             depth_level=depth
         )
 
+        if not related_concepts:
+            _EMPTY_RESPONSE_CACHE[cache_key] = response
+            if len(_EMPTY_RESPONSE_CACHE) > _EMPTY_RESPONSE_CACHE_SIZE:
+                _EMPTY_RESPONSE_CACHE.popitem(last=False)
+
+        return response
+
+    async def conduct_dialogue_stream(
+        self,
+        topic: str,
+        user_position: Optional[str] = None,
+        depth: str = "medium",
+        focus: str = "explore"
+    ) -> AsyncIterator[SocraticQuestion]:
+        """질문이 준비되는 대로 내보내는 스트리밍 변형
+
+        탐구 모드에서는 검색 결과가 도착하기 전에 명료화 질문을 먼저
+        내보내므로, 클라이언트가 첫 질문을 훨씬 일찍 렌더링할 수 있다.
+        """
+        rag_task = asyncio.create_task(self._get_related_concepts(topic))
+        async for q in self._question_stream(
+            topic, user_position, depth, focus, rag_task
+        ):
+            yield q
+
+    async def _question_stream(
+        self,
+        topic: str,
+        user_position: Optional[str],
+        depth: str,
+        focus: str,
+        rag_task
+    ) -> AsyncIterator[SocraticQuestion]:
+        """focus별 질문을 순서대로 산출하는 내부 제너레이터"""
+        stream = self._focus_dispatch.get(
+            focus, self._stream_synthesis_questions
+        )
+        async for q in stream(topic, user_position, depth, rag_task):
+            yield q
+
+    async def _stream_exploration_questions(
+        self, topic, user_position, depth, rag_task
+    ) -> AsyncIterator[SocraticQuestion]:
+        # 명료화/메타 질문은 검색 결과 없이 만들 수 있다
+        head, tail = self._exploration_frame_questions(topic, depth)
+        for q in head:
+            yield q
+        related_concepts = await rag_task
+        for q in self._exploration_concept_questions(topic, related_concepts):
+            yield q
+        for q in tail:
+            yield q
+
+    async def _stream_challenge_questions(
+        self, topic, user_position, depth, rag_task
+    ) -> AsyncIterator[SocraticQuestion]:
+        for q in await self._generate_challenge_questions(
+            topic, user_position, depth, []
+        ):
+            yield q
+
+    async def _stream_synthesis_questions(
+        self, topic, user_position, depth, rag_task
+    ) -> AsyncIterator[SocraticQuestion]:
+        for q in await self._generate_synthesis_questions(
+            topic, user_position, depth, []
+        ):
+            yield q
+
     async def challenge_premise(
         self,
         statement: str,
@@ -144,18 +446,25 @@ class SocraticEngine:
 
         소크라테스적 검토(elenchus)를 통해 숨겨진 가정을 드러내고 도전
         """
-        # Extract hidden premises
-        premises = await self._extract_hidden_premises(statement)
-
-        # Get counter-perspective if specified
-        counter = None
+        # 세 보조 호출은 서로 의존성이 없다 — 전부 먼저 띄우고 한 번에 수거
+        tasks = [
+            self._cached_helper(
+                "hidden_premises", statement,
+                lambda: self._limited(self._extract_hidden_premises, statement)
+            ),
+            self._limited(self._find_alternative_views, statement)
+        ]
         if perspective:
-            counter = await self._generate_counter_perspective(
-                statement, perspective
-            )
+            tasks.append(self._cached_helper(
+                "counter", f"{statement}|{perspective}",
+                lambda: self._limited(
+                    self._generate_counter_perspective, statement, perspective
+                )
+            ))
 
-        # Find alternative views
-        alternatives = await self._find_alternative_views(statement)
+        results = await asyncio.gather(*tasks)
+        premises, alternatives = results[0], results[1]
+        counter = results[2] if perspective else None
 
         return PremiseChallenge(
             hidden_premises=premises,
@@ -174,22 +483,40 @@ class SocraticEngine:
         대립하는 입장들에서 각각의 통찰을 추출하고
         제3의 통합적 관점을 모색
         """
-        # Extract core insights from each position
-        insights = []
-        for pos in positions:
-            insight = await self._extract_core_insight(pos)
-            insights.append(PositionInsight(
-                position=pos[:50] + "..." if len(pos) > 50 else pos,
+        # LLM 클라이언트가 있으면 N+3회 왕복 대신 단일 배치 호출로 —
+        # 네트워크 RTT와 프리필 패스가 한 번으로 줄어든다
+        one_shot = await self._synthesize_one_shot(topic, positions)
+        if one_shot is not None:
+            return one_shot
+
+        # Extract core insights from each position — 입장별로 독립적인
+        # LLM 왕복이므로 직렬 루프 대신 한꺼번에 팬아웃
+        insights_raw = await asyncio.gather(*(
+            self._cached_helper(
+                "core_insight", pos,
+                lambda pos=pos: self._limited(self._extract_core_insight, pos)
+            )
+            for pos in positions
+        ))
+        insights = [
+            PositionInsight(
+                position=_trunc(pos),
                 core_insight=insight
-            ))
-
-        # Attempt synthesis
-        synthesis = await self._attempt_synthesis(topic, insights)
+            )
+            for pos, insight in zip(positions, insights_raw)
+        ]
 
-        # Identify remaining tensions
-        tensions = await self._identify_tensions(insights)
+        # 종합과 긴장 식별은 서로 독립 — 동시 실행
+        synthesis, tensions = await asyncio.gather(
+            self._cached_helper(
+                "synthesis",
+                topic + "|" + "|".join(i.core_insight for i in insights),
+                lambda: self._limited(self._attempt_synthesis, topic, insights)
+            ),
+            self._limited(self._identify_tensions, insights)
+        )
 
-        # Generate deeper questions
+        # Generate deeper questions (위 두 결과에 의존)
         deeper_qs = await self._generate_deeper_questions(
             topic, insights, synthesis, tensions
         )
@@ -203,9 +530,119 @@ class SocraticEngine:
 
     # Private helper methods
 
-    async def _get_related_concepts(self, topic: str):
-        """주제 관련 개념들 검색"""
-        return await self.rag.search(query=topic, limit=5)
+    async def _synthesize_one_shot(
+        self,
+        topic: str,
+        positions: List[str]
+    ) -> Optional[Synthesis]:
+        """네 보조 출력을 단일 JSON 요청으로 배칭
+
+        실패(클라이언트 없음, 파싱 오류, 호출 오류)하면 None을 돌려
+        기존 보조 호출 경로로 폴백한다.
+        """
+        if self.llm is None:
+            return None
+
+        try:
+            dynamic_turn = json.dumps(
+                {"topic": topic, "positions": positions},
+                ensure_ascii=False
+            )
+            async with self._llm_sem:
+                response = await self.llm.messages.create(
+                    system=[{
+                        "type": "text",
+                        "text": _ONE_SHOT_SYNTHESIS_PROMPT,
+                        "cache_control": {"type": "ephemeral"}
+                    }],
+                    messages=[{"role": "user", "content": dynamic_turn}],
+                    # 입장 수에 비례해 출력 예산 확장
+                    max_tokens=300 + 150 * len(positions)
+                )
+            parsed = json.loads(response.content[0].text)
+
+            insights = [
+                PositionInsight(
+                    position=item["position"],
+                    core_insight=item["core_insight"]
+                )
+                for item in parsed["insights"]
+            ]
+            return Synthesis(
+                position_insights=insights,
+                synthesis_attempt=parsed["synthesis"],
+                remaining_tensions=parsed["tensions"],
+                deeper_questions=list(parsed["deeper_questions"])
+            )
+        except Exception:
+            # 배치 경로는 최적화일 뿐 — 어떤 실패든 조용히 폴백
+            return None
+
+    async def _get_related_concepts(self, topic: str, limit: int = 5):
+        """주제 관련 개념들 검색 (SQLite 디스크 캐시 우선)
+
+        임베딩 + ANN 검색은 수십 ms, SQLite 조회는 1ms 미만 — 평가
+        스위트처럼 같은 주제가 반복되는 워크로드에서 재시작 후에도
+        히트가 유지된다. 캐시 오류는 조용히 무시하고 검색으로 폴백.
+        """
+        key = hashlib.blake2b(
+            f"{topic}|{limit}".encode(), digest_size=16
+        ).hexdigest()
+
+        cached = await asyncio.to_thread(self._rag_cache_get, key)
+        if cached is not None:
+            return cached
+
+        results = await self.rag.search(query=topic, limit=limit)
+        await asyncio.to_thread(self._rag_cache_put, key, results)
+        return results
+
+    def _rag_cache_connect(self):
+        conn = sqlite3.connect(self._rag_cache_path, timeout=1.0)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS rag_cache "
+            "(key TEXT PRIMARY KEY, value BLOB, expires_at REAL)"
+        )
+        return conn
+
+    def _rag_cache_get(self, key: str):
+        """디스크 캐시 조회 (스레드에서 실행 — 이벤트 루프 비차단)"""
+        if self._rag_cache_path is None:
+            return None
+        try:
+            with closing(self._rag_cache_connect()) as conn:
+                row = conn.execute(
+                    "SELECT value FROM rag_cache "
+                    "WHERE key = ? AND expires_at > ?",
+                    (key, time.time())
+                ).fetchone()
+            return pickle.loads(row[0]) if row else None
+        except Exception:
+            # DB 잠김/손상 등 — 캐시는 최적화일 뿐이므로 검색으로 폴백
+            return None
+
+    def _rag_cache_put(self, key: str, results):
+        if self._rag_cache_path is None:
+            return
+        try:
+            # closing은 핸들을 닫고, 안쪽 with는 트랜잭션을 커밋한다
+            with closing(self._rag_cache_connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO rag_cache VALUES (?, ?, ?)",
+                    (key, pickle.dumps(results), time.time() + _RAG_CACHE_TTL)
+                )
+        except Exception:
+            pass
+
+    def invalidate_rag_cache(self):
+        """디스크 캐시 전체 삭제 (문서 추가 등 코퍼스 변경 시)"""
+        if self._rag_cache_path is None:
+            return
+        try:
+            with closing(self._rag_cache_connect()) as conn, conn:
+                conn.execute("DELETE FROM rag_cache")
+        except Exception:
+            pass
 
     async def _generate_exploration_questions(
         self,
@@ -214,59 +651,70 @@ class SocraticEngine:
         depth: str,
         related_concepts
     ) -> List[SocraticQuestion]:
-        """탐구형 질문 생성"""
-        questions = []
+        """탐구형 질문 생성 (개념 독립 + 개념 의존 파트 합성)"""
+        head, tail = self._exploration_frame_questions(topic, depth)
+        return [
+            *head,
+            *self._exploration_concept_questions(topic, related_concepts),
+            *tail
+        ]
 
-        # 1. Clarification question
-        questions.append(SocraticQuestion(
-            question=f"'{topic}'에서 가장 핵심적인 개념은 무엇인가요? 그 개념을 어떻게 정의하시겠어요?",
+    def _exploration_frame_questions(
+        self,
+        topic: str,
+        depth: str
+    ) -> tuple:
+        """검색 결과에 의존하지 않는 탐구 질문 (RAG와 겹쳐 조립 가능)"""
+        head = [SocraticQuestion(
+            question=_TEMPLATES["clarification"].format(topic=topic),
             question_type="clarification",
             purpose="핵심 개념의 명확한 정의 도출",
-            follow_up_directions=[
-                "정의의 경계 사례 탐구",
-                "다른 정의와 비교",
-                "정의의 역사적 변천"
-            ]
-        ))
+            follow_up_directions=_FOLLOWUP_CLARIFICATION
+        )]
+
+        tail = []
+        if depth == "deep":
+            tail.append(SocraticQuestion(
+                question=_TEMPLATES["meta_explore"],
+                question_type="meta",
+                purpose="탐구의 목적과 의미 성찰",
+                follow_up_directions=_FOLLOWUP_META_EXPLORE
+            ))
+
+        return head, tail
+
+    def _exploration_concept_questions(
+        self,
+        topic: str,
+        related_concepts
+    ) -> List[SocraticQuestion]:
+        """검색된 개념을 사용하는 탐구 질문"""
+        questions = []
 
-        # 2. Viewpoint question using related concepts
+        # Viewpoint question using related concepts
         if related_concepts:
             other_domain = related_concepts[0].domain
             questions.append(SocraticQuestion(
-                question=f"{other_domain} 분야에서는 이 문제를 어떻게 바라볼까요?",
+                question=_TEMPLATES["viewpoint"].format(domain=other_domain),
                 question_type="viewpoint",
                 purpose="다른 학문적 관점 탐색",
-                follow_up_directions=[
+                follow_up_directions=(
                     f"{other_domain}의 핵심 개념 적용",
-                    "분야 간 차이점과 공통점",
-                    "융합적 관점의 가능성"
-                ]
+                    *_FOLLOWUP_VIEWPOINT_TAIL
+                )
             ))
 
         # 3. Bridge question
         if len(related_concepts) >= 2:
             questions.append(SocraticQuestion(
-                question=f"'{related_concepts[0].name}'과 '{related_concepts[1].name}'이 '{topic}'에서 만난다면 어떤 대화를 나눌까요?",
+                question=_TEMPLATES["bridge"].format(
+                    name_a=related_concepts[0].name,
+                    name_b=related_concepts[1].name,
+                    topic=topic
+                ),
                 question_type="bridge",
                 purpose="분야 간 연결 탐색",
-                follow_up_directions=[
-                    "공통된 구조 찾기",
-                    "상호 보완 가능성",
-                    "새로운 융합 개념 도출"
-                ]
-            ))
-
-        # Adjust depth
-        if depth == "deep":
-            questions.append(SocraticQuestion(
-                question=f"이 주제를 탐구하는 것이 왜 중요한가요? 우리가 진정으로 알고 싶은 것은 무엇인가요?",
-                question_type="meta",
-                purpose="탐구의 목적과 의미 성찰",
-                follow_up_directions=[
-                    "개인적/학문적 동기 탐구",
-                    "더 근본적인 질문으로 이동",
-                    "실천적 함의 고려"
-                ]
+                follow_up_directions=_FOLLOWUP_BRIDGE
             ))
 
         return questions
@@ -284,38 +732,26 @@ class SocraticEngine:
         if user_position:
             # Challenge assumptions
             questions.append(SocraticQuestion(
-                question=f"'{user_position[:30]}...'라고 하셨는데, 이 주장이 전제하는 것은 무엇인가요?",
+                question=_TEMPLATES["assumption"].format(position=user_position[:30]),
                 question_type="assumption",
                 purpose="숨겨진 가정 드러내기",
-                follow_up_directions=[
-                    "전제의 타당성 검토",
-                    "전제가 거짓일 경우의 결과",
-                    "대안적 전제 탐색"
-                ]
+                follow_up_directions=_FOLLOWUP_ASSUMPTION
             ))
 
             # Challenge evidence
             questions.append(SocraticQuestion(
-                question="이 입장을 지지하는 가장 강력한 증거는 무엇인가요? 그 증거는 얼마나 확실한가요?",
+                question=_TEMPLATES["evidence"],
                 question_type="evidence",
                 purpose="근거의 강도 검토",
-                follow_up_directions=[
-                    "반대 증거 탐색",
-                    "증거의 한계 인식",
-                    "추가 증거 필요성"
-                ]
+                follow_up_directions=_FOLLOWUP_EVIDENCE
             ))
 
         # Implication question
         questions.append(SocraticQuestion(
-            question=f"이 생각을 끝까지 밀고 가면 어떤 결론에 도달하나요? 그 결론을 받아들일 수 있나요?",
+            question=_TEMPLATES["implication"],
             question_type="implication",
             purpose="논리적 결과 추적",
-            follow_up_directions=[
-                "극단적 사례 검토",
-                "실제 적용 시 문제점",
-                "수정이 필요한 부분"
-            ]
+            follow_up_directions=_FOLLOWUP_IMPLICATION
         ))
 
         return questions
@@ -331,53 +767,60 @@ class SocraticEngine:
         questions = []
 
         questions.append(SocraticQuestion(
-            question="지금까지 탐구한 다양한 관점들에서 공통적으로 발견되는 것은 무엇인가요?",
+            question=_TEMPLATES["common_pattern"],
             question_type="bridge",
             purpose="공통 패턴 발견",
-            follow_up_directions=[
-                "공통점의 의미",
-                "차이점의 의미",
-                "통합 가능성"
-            ]
+            follow_up_directions=_FOLLOWUP_COMMON_PATTERN
         ))
 
         questions.append(SocraticQuestion(
-            question="서로 대립하는 것처럼 보이는 관점들을 모두 포괄하는 더 높은 관점이 있을까요?",
+            question=_TEMPLATES["dialectic"],
             question_type="viewpoint",
             purpose="변증법적 종합 시도",
-            follow_up_directions=[
-                "각 관점의 부분적 진리",
-                "통합의 조건",
-                "새로운 프레임 창조"
-            ]
+            follow_up_directions=_FOLLOWUP_DIALECTIC
         ))
 
         if depth == "deep":
             questions.append(SocraticQuestion(
-                question="이 탐구를 통해 발견한 것이 당신의 기존 생각을 어떻게 변화시켰나요?",
+                question=_TEMPLATES["meta_synthesis"],
                 question_type="meta",
                 purpose="학습과 변화 성찰",
-                follow_up_directions=[
-                    "인식의 변화 지점",
-                    "남은 불확실성",
-                    "다음 탐구 방향"
-                ]
+                follow_up_directions=_FOLLOWUP_META_SYNTHESIS
             ))
 
         return questions
 
     async def _extract_hidden_premises(self, statement: str) -> List[HiddenPremise]:
-        """숨겨진 전제 추출"""
-        # This would use LLM to analyze statement
-        # Placeholder implementation
-        premises = [
-            HiddenPremise(
+        """숨겨진 전제 추출 (규칙 기반 표지 스캔)
+
+        컴파일된 교대 패턴으로 진술을 한 번만 훑으며 전칭/필연/자명/
+        인과 표지를 찾는다. 표지가 없으면 일반적인 전제 검토로 폴백.
+        """
+        premises = []
+        seen = set()
+        for m in _PREMISE_MARKER_RE.finditer(statement):
+            group = m.lastgroup
+            if group in seen:
+                continue
+            seen.add(group)
+            marker = m.group()
+            premise_type, issue, question = _PREMISE_MARKER_INFO[group]
+            premises.append(HiddenPremise(
+                premise=f"'{marker}' — 진술이 이 표현에 기대어 성립함",
+                premise_type=premise_type,
+                potential_issue=issue.format(marker=marker),
+                challenge_question=question.format(marker=marker)
+            ))
+            if len(premises) == 3:
+                break
+
+        if not premises:
+            premises.append(HiddenPremise(
                 premise="진술에 내포된 가정이 분석됩니다",
                 premise_type="존재론적 가정",
                 potential_issue="이 가정이 보편적으로 성립하지 않을 수 있음",
                 challenge_question="이 가정이 성립하지 않는 경우는 어떤 경우인가요?"
-            )
-        ]
+            ))
         return premises
 
     async def _generate_counter_perspective(
@@ -402,20 +845,14 @@ class SocraticEngine:
         insights: List[PositionInsight]
     ) -> str:
         """종합 시도"""
-        return f"""
-각 입장이 포착하는 부분적 진리를 인정하면서,
-이들을 포괄하는 더 통합적인 관점을 구성할 수 있습니다.
-
-핵심은 대립을 '이것 아니면 저것'으로 보지 않고,
-'이것과 저것의 관계'로 재구성하는 것입니다.
-"""
+        return _SYNTHESIS_BODY
 
     async def _identify_tensions(
         self,
         insights: List[PositionInsight]
     ) -> str:
         """남은 긴장 식별"""
-        return "완전한 종합에 이르지 못한 긴장 지점들이 남아있으며, 이는 더 깊은 탐구의 출발점이 됩니다."
+        return _TENSIONS_BODY
 
     async def _generate_deeper_questions(
         self,
@@ -439,15 +876,26 @@ class SocraticEngine:
     ) -> str:
         """탐구 방향 제안"""
         if related_concepts:
-            domains = set(c.domain for c in related_concepts)
-            return f"""
-다음 탐구 방향을 제안합니다:
-
-1. **개념 명료화**: '{topic}'의 핵심 개념을 더 정확히 정의하기
-2. **분야 간 대화**: {', '.join(list(domains)[:3])} 관점에서 바라보기
-3. **전제 검토**: 당연시되는 가정들을 드러내고 검토하기
-4. **함의 추적**: 이 생각이 이끄는 결론을 끝까지 따라가기
-
-"검증되지 않은 삶은 살 가치가 없다" - 소크라테스
-"""
-        return "개념을 명료화하고 숨겨진 전제를 드러내는 것부터 시작하세요."
+            # islice가 3개를 채우는 즉시 소비를 멈춘다 — 중간 리스트 없음.
+            # 검색 순위(관련도) 순서를 그대로 보존한다.
+            domains = tuple(islice(_unique_domains(related_concepts), 3))
+            return _render_direction(topic, domains)
+        return _DIRECTION_FALLBACK
+
+
+def _unique_domains(related_concepts):
+    """등장 순서를 지키며 도메인을 중복 제거하는 지연 제너레이터"""
+    seen = set()
+    for c in related_concepts:
+        if c.domain not in seen:
+            seen.add(c.domain)
+            yield c.domain
+
+
+@lru_cache(maxsize=512)
+def _render_direction(topic: str, domains: tuple) -> str:
+    """(topic, 도메인 튜플) → 제안 텍스트 렌더링 (반복 질의 캐시)"""
+    return _DIRECTION_TEMPLATE.format(
+        topic=topic,
+        domains=', '.join(domains)
+    )
@@ -8,9 +8,35 @@ Socratic Engine V2 - 소크라테스 대화 엔진 풀버전
 - 적응형 난이도 조절
 """
 
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, AsyncIterator, Set, Tuple, Union
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
+import asyncio
+import re
+import time
+
+# 지식 컨텍스트 캐시 — 같은 주제가 턴/세션을 넘어 반복되므로
+# 벡터 스토어 왕복(수십 ms)을 TTL LRU 조회로 대체한다
+_CTX_CACHE_SIZE = 256
+_CTX_CACHE_TTL = 600.0  # 초
+
+_WS_RE = re.compile(r"\s+")
+
+# 통찰 지표 키워드 — 임포트 시 단일 교대 패턴으로 컴파일해 문장당
+# 한 번의 C 레벨 스캔으로 판정한다 (마커 수만큼의 `in` 호출 제거)
+_INSIGHT_MARKERS = (
+    "깨달", "발견", "연결", "관계", "이해하게",
+    "새롭게", "다르게 보", "결국", "핵심은"
+)
+_INSIGHT_RE = re.compile("|".join(map(re.escape, _INSIGHT_MARKERS)))
+
+# 문장 분리 — 마침표 외에 ?/!/줄바꿈도 경계로 취급, 단일 패스
+_SENT_RE = re.compile(r"[^.?!\n]+[.?!\n]?")
+
+# 세션에 저장하는 사용자 텍스트 상한 — 긴 세션의 메모리 증가를 막는다
+_MAX_TURN_CHARS = 2000
+_MAX_INSIGHT_CHARS = 300
 
 from src.engines.llm_questioner import (
     LLMQuestioner,
@@ -44,7 +70,83 @@ from src.models.dialogue import (
 )
 
 
-@dataclass
+# focus → 초기 질문 전략 (불변 — 호출마다 리스트를 새로 만들 이유가 없다)
+_INITIAL_STRATEGIES = {
+    "explore": (
+        QuestionStrategy.CLARIFY,
+        QuestionStrategy.EXPAND,
+        QuestionStrategy.CONNECT
+    ),
+    "challenge": (
+        QuestionStrategy.CHALLENGE,
+        QuestionStrategy.DEEPEN,
+        QuestionStrategy.META
+    ),
+    "synthesize": (
+        QuestionStrategy.CONNECT,
+        QuestionStrategy.SYNTHESIZE,
+        QuestionStrategy.META
+    ),
+}
+
+# 응답 품질 등급 → 요약 문구
+_QUALITY_TEXT = {
+    5: "훌륭한 통찰",
+    4: "좋은 이해",
+    3: "기본적 파악",
+    2: "부분적 이해",
+    1: "탐구 필요"
+}
+
+# 질문 전략 → 다음 단계 힌트
+_NEXT_STEP_HINTS = {
+    QuestionStrategy.CLARIFY: "개념의 정확한 의미를 생각해보세요.",
+    QuestionStrategy.CHALLENGE: "당연하게 여겨지는 것에 의문을 품어보세요.",
+    QuestionStrategy.EXPAND: "다른 분야에서 비슷한 것을 찾아보세요.",
+    QuestionStrategy.CONNECT: "개념들 사이의 다리를 찾아보세요.",
+    QuestionStrategy.DEEPEN: "더 근본적인 원리로 내려가보세요.",
+    QuestionStrategy.SYNTHESIZE: "대립되는 관점들의 공통점을 찾아보세요.",
+    QuestionStrategy.META: "왜 이것이 중요한지 생각해보세요."
+}
+
+# 전제 도전의 정적 데이터 — 호출마다 재구성하지 않도록 모듈 로드 시 1회 생성.
+# 호출자는 읽기 전용으로만 사용한다.
+_DEFAULT_PREMISES = (
+    {
+        "premise": "이 진술이 가정하는 존재론적 전제",
+        "type": "존재론적",
+        "challenge": "이것이 반드시 존재해야 하는가?",
+        "alternative": "다른 존재론적 가정에서 출발하면?"
+    },
+    {
+        "premise": "이 진술이 가정하는 인식론적 전제",
+        "type": "인식론적",
+        "challenge": "우리는 이것을 어떻게 알 수 있는가?",
+        "alternative": "다른 방법으로 알 수 있다면?"
+    },
+    {
+        "premise": "이 진술에 내포된 가치 판단",
+        "type": "가치론적",
+        "challenge": "왜 이것이 중요한가?",
+        "alternative": "다른 가치 체계에서 보면?"
+    }
+)
+
+_PERSPECTIVE_SPECS = (
+    ("실용주의적 관점",
+     "실제 결과와 유용성에 초점을 맞추면?",
+     "진리는 그것이 작동하는지에 의해 검증됩니다."),
+    ("비판적 관점",
+     "누구의 이익에 봉사하는 주장인가?",
+     "모든 주장에는 권력 관계가 내포되어 있습니다."),
+    ("역사적 관점",
+     "이 생각은 어떤 역사적 맥락에서 나왔는가?",
+     "개념은 시대에 따라 다르게 이해됩니다."),
+)
+
+
+# slots로 인스턴스당 __dict__를 없애 메모리와 속성 접근 비용을 줄인다
+@dataclass(slots=True)
 class SocraticResponse:
     """소크라테스 대화 응답"""
     session_id: str
@@ -91,6 +193,14 @@ class SocraticEngineV2:
         # 대화 모드
         self.mode = DialogueMode.HYBRID
 
+        # (정규화 topic, exclude 집합) → (컨텍스트, 만료 시각) TTL LRU
+        self._ctx_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._ctx_cache_hits = 0
+        self._ctx_cache_misses = 0
+
+        # 세션별 종합 메모 — session_id → (진행 시그니처, 결과)
+        self._synthesis_memo: Dict[str, Tuple[Tuple[int, int, int], Dict[str, Any]]] = {}
+
     def set_mode(self, mode: str):
         """대화 모드 설정"""
         self.mode = DialogueMode(mode)
@@ -116,6 +226,10 @@ class SocraticEngineV2:
         Returns:
             소크라테스 응답 (질문들 포함)
         """
+        # 0. 토픽이 보이는 즉시 RAG 검색을 선발진 — 세션 생성/난이도
+        # 조회와 겹쳐 질문 생성 시점의 보강 검색이 이미 떠 있게 한다
+        self.questioner.prefetch(topic)
+
         # 1. 세션 생성
         session = self.session_mgr.create_session(
             topic=topic,
@@ -132,27 +246,35 @@ class SocraticEngineV2:
 
         # 3. 질문 컨텍스트 구성
         knowledge_context = await self._get_knowledge_context(topic)
+        # 개념명은 한 번만 뽑고 이후에는 슬라이스만 쓴다
+        context_names = [c["name"] for c in knowledge_context]
 
+        # 프롬프트에 들어가는 지식 블록은 이름순으로 고정 — 검색 순위가
+        # 흔들려도 같은 개념 집합이면 바이트 단위로 동일한 접두가 되어
+        # 공급자 측 프롬프트 캐시(KV 재사용)가 히트한다
         context = QuestionContext(
             topic=topic,
             user_position=initial_position,
             dialogue_history=[],
             explored_concepts=[],
-            knowledge_context=knowledge_context,
+            knowledge_context=sorted(
+                knowledge_context, key=lambda c: c["name"]
+            ),
             depth_level=difficulty.question_complexity,
             focus_areas=[focus]
         )
 
-        # 4. 질문 생성
-        questions = await self.questioner.generate_questions(
-            context,
-            num_questions=3,
-            strategies=self._select_initial_strategies(focus)
-        )
-
-        # 5. 학습 경로 제안
-        path_suggestion = await self._generate_path_suggestion(
-            topic, user_id, difficulty.question_complexity
+        # 4-5. 질문 생성과 학습 경로 제안 — 서로 의존성이 없는 왕복이므로
+        # 직렬 await 대신 동시에 실행해 대기 시간을 max()로 줄인다
+        questions, path_suggestion = await asyncio.gather(
+            self.questioner.generate_questions(
+                context,
+                num_questions=3,
+                strategies=self._select_initial_strategies(focus)
+            ),
+            self._generate_path_suggestion(
+                topic, user_id, difficulty.question_complexity
+            )
         )
 
         # 6. 세션에 첫 턴 기록
@@ -171,10 +293,11 @@ class SocraticEngineV2:
             speaker="polymath",
             content=f"'{topic}'에 대한 소크라테스적 탐구를 시작합니다.",
             questions=socratic_questions,
-            related_concepts=[c["name"] for c in knowledge_context[:3]]
+            related_concepts=context_names[:3]
         )
 
         # 7. 응답 구성
+        first_q = questions[0] if questions else None
         return SocraticResponse(
             session_id=session.metadata.session_id,
             questions=questions,
@@ -182,8 +305,8 @@ class SocraticEngineV2:
             learning_path_suggestion=path_suggestion,
             difficulty_feedback=f"현재 난이도: {difficulty.question_complexity}/5",
             encouragement="함께 탐구를 시작해볼까요?",
-            next_step_hint=self._generate_next_step_hint(questions[0] if questions else None),
-            related_concepts=[c["name"] for c in knowledge_context[:5]],
+            next_step_hint=self._generate_next_step_hint(first_q),
+            related_concepts=context_names[:5],
             progress_update={
                 "session_started": True,
                 "topic": topic,
@@ -209,21 +332,57 @@ class SocraticEngineV2:
         Returns:
             다음 소크라테스 응답
         """
+        # 스트리밍 경로를 수집 모드로 소비 — 로직은 한 곳에만 둔다
+        response: Optional[SocraticResponse] = None
+        async for item in self.continue_dialogue_stream(
+            session_id, user_response, user_id
+        ):
+            if isinstance(item, SocraticResponse):
+                response = item
+        return response  # 스트림은 항상 마지막에 최종 응답을 내보낸다
+
+    async def continue_dialogue_stream(
+        self,
+        session_id: str,
+        user_response: str,
+        user_id: str = "default"
+    ) -> AsyncIterator[Union[GeneratedQuestion, SocraticResponse]]:
+        """
+        진행 중인 대화를 스트리밍으로 계속
+
+        다음 질문을 완성되는 순서대로 GeneratedQuestion으로 내보내
+        첫 질문의 체감 지연을 줄이고, 세션 기록이 끝난 뒤 마지막에
+        최종 SocraticResponse를 내보낸다.
+        """
         # 1. 세션 조회
         session = self.session_mgr.get_session(session_id)
         if not session:
             raise ValueError(f"Session {session_id} not found")
 
-        # 2. 사용자 응답 분석
-        analysis = self.difficulty_engine.analyze_response(
-            response=user_response,
-            question_difficulty=session.progress.depth_reached,
-            time_taken=60,  # 실제로는 측정 필요
-            expected_concepts=session.progress.concepts_explored[-3:]
+        # 토픽을 아는 즉시 보강 검색을 선발진 (start_dialogue와 동일)
+        self.questioner.prefetch(session.dialogue.topic)
+
+        # 2. 사용자 응답 분석 — 동기 텍스트 분석이라 스레드로 내려
+        #    루프를 비우고, 데이터 의존이 없는 지식 컨텍스트 검색과 겹친다
+        analysis, knowledge_context = await asyncio.gather(
+            asyncio.to_thread(
+                self.difficulty_engine.analyze_response,
+                user_response,
+                session.progress.depth_reached,
+                60,  # 실제로는 측정 필요
+                session.progress.concepts_explored[-3:]
+            ),
+            self._get_knowledge_context(
+                session.dialogue.topic,
+                exclude=session.progress._explored_set
+            )
         )
+        # 개념명은 한 번만 뽑고 이후에는 슬라이스만 쓴다
+        context_names = [c["name"] for c in knowledge_context]
 
         # 3. 프로필 업데이트
-        self.difficulty_engine.update_profile(
+        await asyncio.to_thread(
+            self.difficulty_engine.update_profile,
             user_id,
             analysis,
             session.dialogue.topic
@@ -232,44 +391,46 @@ class SocraticEngineV2:
         # 4. 난이도 조정
         new_difficulty = self._adjust_difficulty(session, analysis)
 
-        # 5. 사용자 턴 기록
-        insights = self._extract_insights(user_response)
-        self.session_mgr.add_turn(
-            session_id=session_id,
-            speaker="user",
-            content=user_response,
-            insights=insights
-        )
-
-        # 6. 통찰 기록
-        for insight in insights:
-            self.session_mgr.add_insight(session_id, insight)
-
-        # 7. 현재 위치 업데이트
-        self.session_mgr.update_position(session_id, user_response[:200])
-
-        # 8. 다음 질문 생성
-        knowledge_context = await self._get_knowledge_context(
-            session.dialogue.topic,
-            exclude=session.progress.concepts_explored
-        )
+        # 5~7. 사용자 턴/통찰/위치를 한 배치로 기록 — 저널 쓰기 1회
+        # 저장 텍스트는 길이를 제한해 세션당 메모리를 유계로 유지
+        insights = [
+            i[:_MAX_INSIGHT_CHARS] for i in self._extract_insights(user_response)
+        ]
+        with self.session_mgr.begin_batch(session_id):
+            self.session_mgr.add_turn(
+                session_id=session_id,
+                speaker="user",
+                content=user_response[:_MAX_TURN_CHARS],
+                insights=insights
+            )
+            self.session_mgr.add_insights(session_id, insights)
+            self.session_mgr.update_position(session_id, user_response[:200])
 
+        # 8. 다음 질문 생성 (지식 컨텍스트는 2단계에서 이미 조회됨)
+        # 지식 블록은 이름순 고정 — 턴 간 접두 안정성 (위 start_dialogue 참고)
         context = QuestionContext(
             topic=session.dialogue.topic,
             user_position=user_response,
             dialogue_history=self._get_dialogue_history(session),
             explored_concepts=session.progress.concepts_explored,
-            knowledge_context=knowledge_context,
+            knowledge_context=sorted(
+                knowledge_context, key=lambda c: c["name"]
+            ),
             depth_level=new_difficulty,
             focus_areas=[session.dialogue.focus.value]
         )
 
         strategies = self._select_follow_up_strategies(analysis, session)
-        questions = await self.questioner.generate_questions(
+
+        # 완성되는 순서대로 즉시 내보낸다 — 전체 생성 완료를 기다리지 않음
+        questions: List[GeneratedQuestion] = []
+        async for question in self.questioner.stream_questions(
             context,
             num_questions=2,
             strategies=strategies
-        )
+        ):
+            questions.append(question)
+            yield question
 
         # 9. 폴리매스 턴 기록
         socratic_questions = [
@@ -287,29 +448,28 @@ class SocraticEngineV2:
             speaker="polymath",
             content="탐구를 계속합니다.",
             questions=socratic_questions,
-            related_concepts=[c["name"] for c in knowledge_context[:3]]
+            related_concepts=context_names[:3]
         )
 
         # 10. 격려 메시지
-        encouragement = self.difficulty_engine.get_encouragement_message(
+        encouragement = await asyncio.to_thread(
+            self.difficulty_engine.get_encouragement_message,
             analysis, user_id
         )
 
         # 11. 진행 상황
         progress = self.session_mgr.get_session_summary(session_id)
 
-        return SocraticResponse(
+        first_q = questions[0] if questions else None
+        yield SocraticResponse(
             session_id=session_id,
             questions=questions,
             context_summary=self._create_response_summary(analysis),
             learning_path_suggestion=None,
             difficulty_feedback=f"난이도 조정: {analysis.suggested_adjustment:+d}",
             encouragement=encouragement,
-            next_step_hint=self._generate_next_step_hint(
-                questions[0] if questions else None,
-                analysis
-            ),
-            related_concepts=[c["name"] for c in knowledge_context[:5]],
+            next_step_hint=self._generate_next_step_hint(first_q, analysis),
+            related_concepts=context_names[:5],
             progress_update=progress
         )
 
@@ -332,8 +492,20 @@ class SocraticEngineV2:
         """
         session = self.session_mgr.get_session(session_id)
 
-        # 숨겨진 전제 추출
-        hidden_premises = self._extract_hidden_premises(statement)
+        # 전제 추출과 반론 생성은 서로 독립 — 동시에 실행한다.
+        # 전제 추출은 동기 텍스트 분석이므로 스레드로 내려 루프를 비운다.
+        if perspective:
+            perspectives_coro = self._generate_counter_perspective(
+                statement, perspective
+            )
+        else:
+            # 기본적으로 3가지 다른 관점
+            perspectives_coro = self._generate_multiple_perspectives(statement)
+
+        hidden_premises, counter_perspectives = await asyncio.gather(
+            asyncio.to_thread(self._extract_hidden_premises, statement),
+            perspectives_coro
+        )
 
         # 도전 질문 생성
         challenge_questions = []
@@ -345,18 +517,6 @@ class SocraticEngineV2:
                 "alternative": premise["alternative"]
             })
 
-        # 다른 관점에서의 반론
-        counter_perspectives = []
-        if perspective:
-            counter_perspectives = await self._generate_counter_perspective(
-                statement, perspective
-            )
-        else:
-            # 기본적으로 3가지 다른 관점
-            counter_perspectives = await self._generate_multiple_perspectives(
-                statement
-            )
-
         # 전제 도전 기록
         if session:
             self.session_mgr.challenge_premise(session_id, statement)
@@ -394,6 +554,12 @@ class SocraticEngineV2:
         # 발견된 연결들
         connections = session.progress.connections_made
 
+        # 새 턴 없이 반복 호출(폴링)되면 직전 종합을 그대로 재사용
+        sig = (len(concepts), len(insights), len(connections))
+        memo = self._synthesis_memo.get(session_id)
+        if memo is not None and memo[0] == sig:
+            return memo[1]
+
         # 종합 시도
         synthesis = self._create_synthesis(concepts, insights, connections)
 
@@ -404,7 +570,7 @@ class SocraticEngineV2:
         # 세션 완료 처리 (선택적)
         # self.session_mgr.complete_session(session_id)
 
-        return {
+        result = {
             "topic": session.dialogue.topic,
             "explored_concepts": concepts,
             "key_insights": insights[-5:],  # 최근 5개
@@ -414,6 +580,8 @@ class SocraticEngineV2:
             "deeper_questions": deeper_questions,
             "session_summary": self.session_mgr.get_session_summary(session_id)
         }
+        self._synthesis_memo[session_id] = (sig, result)
+        return result
 
     async def get_learning_path(
         self,
@@ -454,23 +622,20 @@ class SocraticEngineV2:
         Returns:
             진행 상황 요약
         """
-        # 난이도 엔진에서 성과 요약
-        performance = self.difficulty_engine.get_performance_summary(user_id)
-
-        # 세션 목록
-        sessions = self.session_mgr.list_sessions(user_id)
-
-        # 총 통계
-        total_concepts = set()
-        total_insights = 0
-        total_connections = 0
-
-        for session_info in sessions:
-            session = self.session_mgr.get_session(session_info["session_id"])
-            if session:
-                total_concepts.update(session.progress.concepts_explored)
-                total_insights += len(session.progress.insights_gained)
-                total_connections += len(session.progress.connections_made)
+        # 세션 목록/집계는 콜드 세션 로드로 디스크를 탈 수 있으므로
+        # 스레드로 내리고, 독립적인 성과 요약과 동시에 실행한다.
+        # (둘 다 인덱스를 만질 수 있어 매니저 호출은 한 스레드에 직렬화)
+        def _collect_sessions():
+            sessions = self.session_mgr.list_sessions(user_id)
+            stats = self.session_mgr.aggregate_user_stats(user_id)
+            return sessions, stats
+
+        performance, (sessions, stats) = await asyncio.gather(
+            asyncio.to_thread(
+                self.difficulty_engine.get_performance_summary, user_id
+            ),
+            asyncio.to_thread(_collect_sessions)
+        )
 
         return {
             "performance": performance,
@@ -480,9 +645,9 @@ class SocraticEngineV2:
                 "completed": len([s for s in sessions if s["status"] == "completed"])
             },
             "learning": {
-                "concepts_explored": len(total_concepts),
-                "insights_gained": total_insights,
-                "connections_made": total_connections
+                "concepts_explored": len(stats["concepts_explored"]),
+                "insights_gained": stats["insights_gained"],
+                "connections_made": stats["connections_made"]
             },
             "recent_sessions": sessions[:5]
         }
@@ -492,9 +657,25 @@ class SocraticEngineV2:
     async def _get_knowledge_context(
         self,
         topic: str,
-        exclude: Optional[List[str]] = None
+        exclude: Optional[Set[str]] = None
     ) -> List[Dict[str, Any]]:
-        """지식 컨텍스트 검색"""
+        """지식 컨텍스트 검색 (TTL LRU 캐시 전면 배치)
+
+        공백/대소문자만 다른 주제를 같은 키로 접고, exclude 집합까지
+        키에 포함해 정확히 같은 조회만 재사용한다. exclude는 집합이라
+        결과당 멤버십 판정이 O(1)이다.
+        """
+        key = (
+            _WS_RE.sub(" ", topic.strip().lower()),
+            frozenset(exclude or ())
+        )
+        cached = self._ctx_cache.get(key)
+        if cached is not None and time.monotonic() < cached[1]:
+            self._ctx_cache.move_to_end(key)
+            self._ctx_cache_hits += 1
+            return cached[0]
+        self._ctx_cache_misses += 1
+
         results = await self.rag.search(query=topic, limit=10)
 
         context = []
@@ -506,32 +687,21 @@ class SocraticEngineV2:
                 "domain": r.domain,
                 "description": r.description[:300] if hasattr(r, 'description') else ""
             })
+        context = context[:7]
 
-        return context[:7]
+        self._ctx_cache[key] = (context, time.monotonic() + _CTX_CACHE_TTL)
+        if len(self._ctx_cache) > _CTX_CACHE_SIZE:
+            self._ctx_cache.popitem(last=False)
+        return context
 
     def _select_initial_strategies(
         self,
         focus: str
-    ) -> List[QuestionStrategy]:
-        """초기 질문 전략 선택"""
-        if focus == "explore":
-            return [
-                QuestionStrategy.CLARIFY,
-                QuestionStrategy.EXPAND,
-                QuestionStrategy.CONNECT
-            ]
-        elif focus == "challenge":
-            return [
-                QuestionStrategy.CHALLENGE,
-                QuestionStrategy.DEEPEN,
-                QuestionStrategy.META
-            ]
-        else:  # synthesize
-            return [
-                QuestionStrategy.CONNECT,
-                QuestionStrategy.SYNTHESIZE,
-                QuestionStrategy.META
-            ]
+    ) -> Tuple[QuestionStrategy, ...]:
+        """초기 질문 전략 선택 (공유 튜플 — 할당 없음)"""
+        return _INITIAL_STRATEGIES.get(
+            focus, _INITIAL_STRATEGIES["synthesize"]
+        )
 
     def _select_follow_up_strategies(
         self,
@@ -574,39 +744,35 @@ class SocraticEngineV2:
         adjustment = analysis.suggested_adjustment
 
         new_level = max(1, min(5, current + adjustment))
-        self.session_mgr.set_depth(session.metadata.session_id, new_level)
+        # 변화가 없으면 저널 쓰기를 건너뛴다 — 안정 구간에서 흔한 경우
+        if new_level != current:
+            self.session_mgr.set_depth(session.metadata.session_id, new_level)
 
         return new_level
 
     def _extract_insights(self, response: str) -> List[str]:
-        """응답에서 통찰 추출"""
+        """응답에서 통찰 추출 (컴파일된 다중 패턴 스캔)"""
         insights = []
-
-        # 통찰 지표 키워드
-        insight_markers = [
-            "깨달", "발견", "연결", "관계", "이해하게",
-            "새롭게", "다르게 보", "결국", "핵심은"
-        ]
-
-        sentences = response.split(".")
-        for sentence in sentences:
-            if any(marker in sentence for marker in insight_markers):
+        for match in _SENT_RE.finditer(response):
+            sentence = match.group(0)
+            if _INSIGHT_RE.search(sentence):
                 insights.append(sentence.strip())
-
-        return insights[:3]  # 최대 3개
+                if len(insights) == 3:  # 최대 3개 — 채우면 즉시 중단
+                    break
+        return insights
 
     def _get_dialogue_history(
         self,
         session: Session
     ) -> List[Dict[str, str]]:
-        """대화 히스토리 추출"""
-        history = []
-        for turn in session.dialogue.turns[-6:]:  # 최근 6턴
-            history.append({
+        """대화 히스토리 추출 (최근 턴 뷰 — 전체 리스트 슬라이스 없음)"""
+        return [
+            {
                 "speaker": turn.speaker,
                 "content": turn.content[:200]
-            })
-        return history
+            }
+            for turn in session.dialogue.recent_turns
+        ]
 
     def _create_context_summary(
         self,
@@ -616,22 +782,15 @@ class SocraticEngineV2:
         if not knowledge_context:
             return "관련 지식을 검색 중입니다..."
 
-        domains = list(set(c["domain"] for c in knowledge_context))
+        # set 경유는 순서가 비결정적 — dict.fromkeys로 첫 등장 순서를 보존
+        domains = list(dict.fromkeys(c["domain"] for c in knowledge_context))
         concepts = [c["name"] for c in knowledge_context[:3]]
 
         return f"관련 분야: {', '.join(domains[:3])} | 연결 개념: {', '.join(concepts)}"
 
     def _create_response_summary(self, analysis: ResponseAnalysis) -> str:
         """응답 분석 요약"""
-        quality_text = {
-            5: "훌륭한 통찰",
-            4: "좋은 이해",
-            3: "기본적 파악",
-            2: "부분적 이해",
-            1: "탐구 필요"
-        }
-
-        summary = quality_text.get(analysis.quality.value, "분석 중")
+        summary = _QUALITY_TEXT.get(analysis.quality.value, "분석 중")
 
         if analysis.breakthrough_signals:
             summary += " | 돌파구 발견!"
@@ -649,17 +808,7 @@ class SocraticEngineV2:
         if not question:
             return "다음 질문을 생각해보세요."
 
-        hints = {
-            QuestionStrategy.CLARIFY: "개념의 정확한 의미를 생각해보세요.",
-            QuestionStrategy.CHALLENGE: "당연하게 여겨지는 것에 의문을 품어보세요.",
-            QuestionStrategy.EXPAND: "다른 분야에서 비슷한 것을 찾아보세요.",
-            QuestionStrategy.CONNECT: "개념들 사이의 다리를 찾아보세요.",
-            QuestionStrategy.DEEPEN: "더 근본적인 원리로 내려가보세요.",
-            QuestionStrategy.SYNTHESIZE: "대립되는 관점들의 공통점을 찾아보세요.",
-            QuestionStrategy.META: "왜 이것이 중요한지 생각해보세요."
-        }
-
-        return hints.get(question.strategy, "깊이 생각해보세요.")
+        return _NEXT_STEP_HINTS.get(question.strategy, "깊이 생각해보세요.")
 
     async def _generate_path_suggestion(
         self,
@@ -679,28 +828,8 @@ class SocraticEngineV2:
 
     def _extract_hidden_premises(self, statement: str) -> List[Dict[str, str]]:
         """숨겨진 전제 추출"""
-        # 기본 분석 (실제로는 LLM 사용)
-        premises = [
-            {
-                "premise": "이 진술이 가정하는 존재론적 전제",
-                "type": "존재론적",
-                "challenge": "이것이 반드시 존재해야 하는가?",
-                "alternative": "다른 존재론적 가정에서 출발하면?"
-            },
-            {
-                "premise": "이 진술이 가정하는 인식론적 전제",
-                "type": "인식론적",
-                "challenge": "우리는 이것을 어떻게 알 수 있는가?",
-                "alternative": "다른 방법으로 알 수 있다면?"
-            },
-            {
-                "premise": "이 진술에 내포된 가치 판단",
-                "type": "가치론적",
-                "challenge": "왜 이것이 중요한가?",
-                "alternative": "다른 가치 체계에서 보면?"
-            }
-        ]
-        return premises
+        # 기본 분석 (실제로는 LLM 사용) — 공유 상수의 얕은 복사만 반환
+        return list(_DEFAULT_PREMISES)
 
     async def _generate_counter_perspective(
         self,
@@ -714,29 +843,29 @@ class SocraticEngineV2:
             "key_insight": f"{perspective}이 강조하는 가치는 다른 측면을 조명합니다."
         }]
 
+    async def _generate_one_perspective(
+        self,
+        statement: str,
+        name: str,
+        counter_argument: str,
+        key_insight: str
+    ) -> Dict[str, str]:
+        """단일 관점 생성 (LLM 연결 시 호출별 독립 왕복이 된다)"""
+        return {
+            "perspective": name,
+            "counter_argument": counter_argument,
+            "key_insight": key_insight
+        }
+
     async def _generate_multiple_perspectives(
         self,
         statement: str
     ) -> List[Dict[str, str]]:
-        """다양한 관점 생성"""
-        perspectives = [
-            {
-                "perspective": "실용주의적 관점",
-                "counter_argument": "실제 결과와 유용성에 초점을 맞추면?",
-                "key_insight": "진리는 그것이 작동하는지에 의해 검증됩니다."
-            },
-            {
-                "perspective": "비판적 관점",
-                "counter_argument": "누구의 이익에 봉사하는 주장인가?",
-                "key_insight": "모든 주장에는 권력 관계가 내포되어 있습니다."
-            },
-            {
-                "perspective": "역사적 관점",
-                "counter_argument": "이 생각은 어떤 역사적 맥락에서 나왔는가?",
-                "key_insight": "개념은 시대에 따라 다르게 이해됩니다."
-            }
-        ]
-        return perspectives
+        """다양한 관점 생성 — 관점별로 동시에 팬아웃"""
+        return list(await asyncio.gather(*(
+            self._generate_one_perspective(statement, *spec)
+            for spec in _PERSPECTIVE_SPECS
+        )))
 
     def _create_synthesis(
         self,
@@ -246,6 +246,10 @@ class Concept:
     # 임베딩 (벡터 검색용)
     embedding: Optional[List[float]] = None
 
+    # int8 양자화 임베딩 (유사도 계산 대역폭 절감용, 선택)
+    embedding_int8: Optional[List[int]] = None
+    embedding_scale: Optional[float] = None
+
     # 검색 결과 메타데이터
     similarity: float = 0.0
 
@@ -276,6 +280,17 @@ class Concept:
             return self.knowledge.core_principles[0]
         return ""
 
+    def quantize_embedding(self) -> None:
+        """FP32 임베딩을 대칭 스케일 int8로 양자화"""
+        if not self.embedding:
+            return
+        peak = max(abs(v) for v in self.embedding) or 1.0
+        scale = peak / 127.0
+        self.embedding_int8 = [
+            max(-127, min(127, round(v / scale))) for v in self.embedding
+        ]
+        self.embedding_scale = scale
+
     def get_ksea_summary(self) -> Dict[str, Any]:
         """KSEA 요약"""
         return {
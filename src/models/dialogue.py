@@ -5,6 +5,7 @@ Dialogue Models - 대화 모델
 """
 
 from typing import List, Optional, Dict, Any
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -42,7 +43,7 @@ class DepthLevel(Enum):
     DEEP = "deep"
 
 
-@dataclass
+@dataclass(slots=True)
 class SocraticQuestion:
     """
     소크라테스적 질문
@@ -85,6 +86,10 @@ class DialogueState:
 
     # Progress tracking
     turns: List[DialogueTurn] = field(default_factory=list)
+    # 최근 6턴의 O(1) 뷰 — 히스토리 조회 시 전체 리스트 슬라이스 회피 (직렬화 제외)
+    recent_turns: deque = field(
+        default_factory=lambda: deque(maxlen=6), repr=False, compare=False
+    )
     current_position: str = ""  # 현재 도달한 위치/결론
     explored_concepts: List[str] = field(default_factory=list)
     challenged_premises: List[str] = field(default_factory=list)
@@ -97,6 +102,7 @@ class DialogueState:
     def add_turn(self, turn: DialogueTurn):
         """턴 추가"""
         self.turns.append(turn)
+        self.recent_turns.append(turn)
         self.updated_at = datetime.now()
 
 
@@ -117,7 +117,8 @@ def register_socratic_tools(server: Server):
             focus=focus
         )
 
-        text = f"""
+        # += 재할당 대신 조각 리스트 + join — 응답 트리를 한 번만 순회
+        parts = [f"""
 ## 소크라테스적 탐구: {topic}
 
 ### 현재 위치
@@ -125,27 +126,27 @@ def register_socratic_tools(server: Server):
 
 ### 탐구 질문
 
-"""
+"""]
         for i, question in enumerate(response.questions, 1):
             q_type = SOCRATIC_QUESTION_TYPES.get(question.question_type, {})
-            text += f"""
+            parts.append(f"""
 **질문 {i}** ({q_type.get('name', question.question_type)})
 
 > {question.question}
 
 *목적*: {q_type.get('purpose', '')}
 
-"""
+""")
 
-        text += f"""
+        parts.append(f"""
 ### 관련 개념들
 {', '.join(response.related_concepts[:5])}
 
 ### 추천 탐구 방향
 {response.suggested_direction}
-"""
+""")
 
-        return [TextContent(type="text", text=text)]
+        return [TextContent(type="text", text="".join(parts))]
 
     @server.call_tool()
     async def challenge_premise(
@@ -169,38 +170,38 @@ def register_socratic_tools(server: Server):
             perspective=perspective
         )
 
-        text = f"""
+        parts = [f"""
 ## 전제 도전: "{statement[:50]}..."
 
 ### 발견된 숨겨진 전제들
 
-"""
+"""]
         for i, premise in enumerate(challenge.hidden_premises, 1):
-            text += f"""
+            parts.append(f"""
 **전제 {i}**: {premise.premise}
 
 - **유형**: {premise.premise_type}
 - **문제점**: {premise.potential_issue}
 - **도전 질문**: *{premise.challenge_question}*
 
-"""
+""")
 
         if perspective:
-            text += f"""
+            parts.append(f"""
 ### {perspective} 관점에서의 반론
 
 {challenge.counter_perspective}
 
-"""
+""")
 
-        text += f"""
+        parts.append("""
 ### 대안적 관점들
 
-"""
+""")
         for alt in challenge.alternative_views[:3]:
-            text += f"- **{alt.name}**: {alt.description}\n"
+            parts.append(f"- **{alt.name}**: {alt.description}\n")
 
-        return [TextContent(type="text", text=text)]
+        return [TextContent(type="text", text="".join(parts))]
 
     @server.call_tool()
     async def get_question_types(
@@ -220,9 +221,9 @@ def register_socratic_tools(server: Server):
         else:
             types = SOCRATIC_QUESTION_TYPES
 
-        text = "## 7가지 소크라테스적 질문 유형\n\n"
+        parts = ["## 7가지 소크라테스적 질문 유형\n\n"]
         for key, q_type in types.items():
-            text += f"""
+            parts.append(f"""
 ### {q_type['name']}
 
 **설명**: {q_type['description']}
@@ -230,12 +231,12 @@ def register_socratic_tools(server: Server):
 **목적**: {q_type['purpose']}
 
 **예시 질문**:
-"""
+""")
             for example in q_type['examples']:
-                text += f"- {example}\n"
-            text += "\n---\n"
+                parts.append(f"- {example}\n")
+            parts.append("\n---\n")
 
-        return [TextContent(type="text", text=text)]
+        return [TextContent(type="text", text="".join(parts))]
 
     @server.call_tool()
     async def synthesize_dialogue(
@@ -259,23 +260,23 @@ def register_socratic_tools(server: Server):
             positions=positions
         )
 
-        text = f"""
+        parts = [f"""
 ## 변증법적 종합: {topic}
 
 ### 제시된 입장들
 
-"""
+"""]
         for i, pos in enumerate(positions, 1):
-            text += f"{i}. {pos}\n"
+            parts.append(f"{i}. {pos}\n")
 
-        text += f"""
+        parts.append("""
 ### 각 입장의 핵심 통찰
 
-"""
+""")
         for insight in synthesis.position_insights:
-            text += f"- **{insight.position}**: {insight.core_insight}\n"
+            parts.append(f"- **{insight.position}**: {insight.core_insight}\n")
 
-        text += f"""
+        parts.append(f"""
 ### 종합 시도
 
 {synthesis.synthesis_attempt}
@@ -286,11 +287,11 @@ def register_socratic_tools(server: Server):
 
 ### 더 깊은 탐구를 위한 질문
 
-"""
+""")
         for q in synthesis.deeper_questions[:3]:
-            text += f"> {q}\n\n"
+            parts.append(f"> {q}\n\n")
 
-        return [TextContent(type="text", text=text)]
+        return [TextContent(type="text", text="".join(parts))]
 
     @server.call_tool()
     async def set_dialogue_mode(